@@ -0,0 +1,266 @@
+"""Benchmarks for the Python services on seeded synthetic data.
+
+usage:
+    python run_benchmarks.py --jobs 10000 --users 5000
+    python run_benchmarks.py --save-baseline baseline.json
+    python run_benchmarks.py --baseline baseline.json --tolerance 0.25   # exits 1 on regression
+"""
+import argparse
+import itertools
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for sub in ("job_scarpper", "reccomondation system", "chatbot"):
+    sys.path.insert(0, os.path.join(SRC_DIR, sub))
+
+# Keep the services' import-time side effects away from real data and credentials
+WORK_DIR = tempfile.mkdtemp(prefix="innovatehub-bench-")
+os.environ["OPPORTUNITY_DB"] = os.path.join(WORK_DIR, "opportunities.sqlite3")
+os.environ.setdefault("API_KEY", "benchmark")
+os.environ.setdefault("BACKEND_URL", "http://localhost:8000")
+os.environ["SCRAPER_TOKEN"] = ""
+
+import synthetic  # noqa: E402
+
+# p95 of fewer samples than this is too noisy to gate on; such results are compared on throughput only
+MIN_PERCENTILE_OPS = 20
+
+
+# ---------------- Measurement ----------------
+def _percentile(sorted_samples, q):
+    if not sorted_samples:
+        return 0.0
+    index = min(len(sorted_samples) - 1, int(round(q / 100 * (len(sorted_samples) - 1))))
+    return sorted_samples[index]
+
+
+def measure(name, fn, items, units=None, memory=True):
+    """Time fn(item) for every item, then rerun under tracemalloc for peak memory."""
+    items = list(items)
+    samples = []
+    start = time.perf_counter()
+    for item in items:
+        t0 = time.perf_counter()
+        fn(item)
+        samples.append(time.perf_counter() - t0)
+    seconds = time.perf_counter() - start
+
+    peak_mb = None
+    if memory:
+        tracemalloc.start()
+        for item in items:
+            fn(item)
+        peak_mb = tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+        tracemalloc.stop()
+
+    samples.sort()
+    units = len(items) if units is None else units
+    result = {
+        "name": name,
+        "ops": len(items),
+        "units": units,
+        "seconds": round(seconds, 4),
+        "throughput": round(units / seconds, 2) if seconds else None,
+        "p50_ms": round(_percentile(samples, 50) * 1000, 4),
+        "p95_ms": round(_percentile(samples, 95) * 1000, 4),
+        "p99_ms": round(_percentile(samples, 99) * 1000, 4),
+        "peak_mb": round(peak_mb, 2) if peak_mb is not None else None,
+    }
+    print(
+        f"⏱️  {name:<32} {result['throughput'] or 0:>12.1f} units/s  "
+        f"p50 {result['p50_ms']:.3f}ms  p95 {result['p95_ms']:.3f}ms  p99 {result['p99_ms']:.3f}ms"
+        + (f"  peak {result['peak_mb']:.1f}MB" if peak_mb is not None else "")
+    )
+    return result
+
+
+def skipped(name, reason):
+    print(f"⏭️  {name:<32} skipped: {reason}")
+    return {"name": name, "skipped": reason}
+
+
+# ---------------- Suites ----------------
+def bench_scraper(args, data):
+    from job_scarpper import _compose_description, build_opportunity, extract_details_from_description
+
+    descriptions = [_compose_description(item) for item in data["raw_jobs"]]
+    return [
+        measure("scraper.extract_details", extract_details_from_description, descriptions, memory=args.memory),
+        measure("scraper.build_opportunity", build_opportunity, data["raw_jobs"], memory=args.memory),
+    ]
+
+
+def bench_ats(args, data):
+    from job_matching import calculate_ats_score, top_ats
+
+    jobs = data["opportunities"]
+    pairs = list(zip(itertools.cycle(data["resumes"]), jobs))
+    resumes = data["resumes"][:args.ats_resumes]
+    return [
+        measure("ats.calculate_ats_score", lambda p: calculate_ats_score(*p), pairs, memory=args.memory),
+        measure("ats.top_ats(k=10)", lambda r: top_ats(r, jobs, 10), resumes,
+                units=len(jobs) * len(resumes), memory=args.memory),
+    ]
+
+
+def bench_recommender(args, data):
+    from build_artifacts import build
+    from serve import RecommenderStore
+
+    out_dir = os.path.join(WORK_DIR, "recommender")
+    users = data["users"]
+    results = [
+        measure("recommender.build", lambda _: build(users, out_dir), range(args.iterations),
+                units=len(users) * args.iterations, memory=args.memory),
+    ]
+    store = RecommenderStore(out_dir)
+    rng = random.Random(args.seed)
+    lookups = [rng.choice(users)["id"] for _ in range(args.lookups)]
+    results.append(measure("recommender.recommend", store.recommend, lookups, memory=args.memory))
+    return results
+
+
+def bench_chatbot(args, data):
+    try:
+        import chatflask
+    except ImportError as e:
+        return [skipped("chatbot", f"missing dependency ({e.name})")]
+
+    queries = synthetic.chat_queries(args.queries, chatflask.questions, seed=args.seed)
+    return [
+        measure("chatbot.preprocess", chatflask.preprocess, queries, memory=args.memory),
+        measure("chatbot.retrieval", chatflask.chatbot, queries, memory=args.memory),
+    ]
+
+
+def bench_endpoints(args, data):
+    cwd = os.getcwd()
+    os.chdir(WORK_DIR)  # format.py looks for legacy JSON files in the working directory
+    try:
+        import format as jobs_api
+    finally:
+        os.chdir(cwd)
+
+    jobs_api.store.upsert_many(data["opportunities"])
+    client = jobs_api.app.test_client()
+    rng = random.Random(args.seed)
+
+    def get(url):
+        response = client.get(url)
+        assert response.status_code == 200, (url, response.status_code)
+
+    def post_ats(resume_text):
+        response = client.post("/jobs/ats?k=10", data={"resume_text": resume_text})
+        assert response.status_code == 200, response.status_code
+
+    list_urls = [f"/jobs?limit=100&offset={rng.randrange(max(1, len(data['opportunities']) - 100))}"
+                 for _ in range(args.requests)]
+    search_urls = [f"/jobs/search?q={rng.choice(synthetic.SKILLS).split()[0]}" for _ in range(args.requests)]
+    return [
+        measure("api.GET /jobs", get, list_urls, memory=args.memory),
+        measure("api.GET /jobs/search", get, search_urls, memory=args.memory),
+        measure("api.POST /jobs/ats", post_ats, data["resumes"][:args.ats_resumes], memory=args.memory),
+    ]
+
+
+SUITES = {
+    "scraper": bench_scraper,
+    "ats": bench_ats,
+    "recommender": bench_recommender,
+    "chatbot": bench_chatbot,
+    "endpoints": bench_endpoints,
+}
+
+
+# ---------------- Regression check ----------------
+def find_regressions(results, baseline, tolerance):
+    """Compare against a saved run: slower p95 or lower throughput than tolerance allows is a regression.
+
+    The p95 check only applies when both runs have at least MIN_PERCENTILE_OPS samples.
+    """
+    previous = {r["name"]: r for r in baseline.get("results", []) if "skipped" not in r}
+    regressions = []
+    for r in results:
+        old = previous.get(r["name"])
+        if old is None or "skipped" in r:
+            continue
+        enough_samples = min(old["ops"], r["ops"]) >= MIN_PERCENTILE_OPS
+        if enough_samples and old["p95_ms"] and r["p95_ms"] > old["p95_ms"] * (1 + tolerance):
+            regressions.append(f"{r['name']}: p95 {old['p95_ms']}ms -> {r['p95_ms']}ms")
+        if old["throughput"] and r["throughput"] < old["throughput"] * (1 - tolerance):
+            regressions.append(f"{r['name']}: throughput {old['throughput']} -> {r['throughput']} units/s")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--suites", default=",".join(SUITES), help="comma-separated subset of " + ", ".join(SUITES))
+    parser.add_argument("--jobs", type=int, default=1000, help="synthetic RapidAPI job payloads (1k-1M)")
+    parser.add_argument("--users", type=int, default=2000)
+    parser.add_argument("--resumes", type=int, default=50)
+    parser.add_argument("--ats-resumes", type=int, default=20, help="resumes scored against the full job set")
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--lookups", type=int, default=10000)
+    parser.add_argument("--requests", type=int, default=200, help="HTTP requests per endpoint")
+    parser.add_argument("--iterations", type=int, default=5, help="repetitions of whole-dataset steps such as the recommender build")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-memory", dest="memory", action="store_false", help="skip the tracemalloc pass")
+    parser.add_argument("--output", help="write the JSON report here")
+    parser.add_argument("--baseline", help="previous report to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--save-baseline", help="write this run as the new baseline")
+    args = parser.parse_args()
+
+    suites = [s.strip() for s in args.suites.split(",") if s.strip()]
+    unknown = set(suites) - set(SUITES)
+    if unknown:
+        parser.error(f"unknown suites: {', '.join(sorted(unknown))}")
+
+    print(f"🧪 Generating data (jobs={args.jobs}, users={args.users}, seed={args.seed})")
+    raw_jobs = synthetic.rapidapi_jobs(args.jobs, seed=args.seed)
+    from job_scarpper import build_opportunity
+
+    data = {
+        "raw_jobs": raw_jobs,
+        "opportunities": [build_opportunity(item) for item in raw_jobs],
+        "resumes": synthetic.resumes(args.resumes, seed=args.seed),
+        "users": synthetic.user_profiles(args.users, seed=args.seed),
+    }
+
+    results = []
+    try:
+        for suite in suites:
+            results.extend(SUITES[suite](args, data))
+    finally:
+        shutil.rmtree(WORK_DIR, ignore_errors=True)
+
+    report = {
+        "created_at": time.time(),
+        "params": {k: v for k, v in vars(args).items() if k not in ("baseline", "save_baseline", "output")},
+        "results": results,
+    }
+    for path in filter(None, (args.output, args.save_baseline)):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"✅ Saved report to {path}")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            regressions = find_regressions(results, json.load(f), args.tolerance)
+        if regressions:
+            print("\n❌ Performance regressions:")
+            for line in regressions:
+                print(f"   {line}")
+            sys.exit(1)
+        print("\n✅ No regressions beyond tolerance")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""Seeded synthetic data shaped like what the Python services see in production."""
+import random
+
+
+SKILLS = [
+    "Python", "Java", "JavaScript", "TypeScript", "C++", "Go", "Ruby", "PHP", "Kotlin",
+    "React", "Angular", "Vue", "Next.js", "Node.js", "Express", "HTML", "CSS", "Tailwind",
+    "SQL", "MySQL", "PostgreSQL", "MongoDB", "Redis", "Machine Learning", "Deep Learning",
+    "TensorFlow", "PyTorch", "AWS", "Azure", "Google Cloud", "Docker", "Kubernetes", "Terraform",
+    "Jenkins", "CI/CD", "Git",
+]
+SOFT_SKILLS = ["Leadership", "Communication", "Teamwork", "Problem-solving"]
+TOPICS = ["Data Structures", "Algorithms", "OOP", "Database", "Cloud Computing"]
+TITLES = [
+    "Full Stack Developer", "Backend Engineer", "Frontend Developer", "Data Scientist",
+    "Machine Learning Engineer", "DevOps Engineer", "Software Engineer Intern", "Cloud Engineer",
+]
+COMPANIES = ["Acme", "Globex", "Initech", "Umbrella", "Hooli", "Stark Industries", "Wayne Enterprises", "Cyberdyne"]
+CITIES = ["Bengaluru", "Mangaluru", "Hyderabad", "Pune", "Chennai", "Mumbai", ""]
+PROJECTS = ["chatbot", "portfolio website", "ecommerce app", "recommendation system", "attendance tracker",
+            "weather app", "blog platform", "expense manager", "image classifier", "url shortener"]
+CERTIFICATIONS = ["AWS", "Azure", "Oracle", "TensorFlow", "Google Cloud", "Kubernetes", "Scrum"]
+FILLER = (
+    "We are looking for a motivated engineer to join our growing team. You will design, build and "
+    "maintain scalable services, collaborate with product managers and review code. "
+).split()
+
+
+def _description(rng, skills):
+    words = rng.choices(FILLER, k=rng.randint(60, 240))
+    for skill in skills:
+        words.insert(rng.randrange(len(words) + 1), skill)
+    if rng.random() < 0.2:
+        words += ["The", "process", "has", str(rng.randint(2, 5)), "rounds."]
+    if rng.random() < 0.2:
+        words += ["Minimum", f"{rng.randint(60, 80)}%", "required."]
+    return " ".join(words)
+
+
+def rapidapi_job(rng, i):
+    """One item as returned in the `data` list of the JSearch /search response."""
+    skills = rng.sample(SKILLS, rng.randint(2, 8)) + rng.sample(SOFT_SKILLS + TOPICS, rng.randint(0, 3))
+    item = {
+        "job_id": f"job-{i:08d}",
+        "job_title": f"{rng.choice(['', 'Senior ', 'Junior ', 'Lead '])}{rng.choice(TITLES)}",
+        "employer_name": rng.choice(COMPANIES),
+        "job_city": rng.choice(CITIES),
+        "job_country": "IN",
+        "job_employment_type": rng.choice(["FULLTIME", "INTERN", "CONTRACTOR", None]),
+        "job_is_remote": rng.random() < 0.3,
+        "job_apply_link": f"https://example.com/apply/{i}",
+        "job_google_link": f"https://google.com/search?q=job-{i}",
+        "job_posted_at_datetime_utc": f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T00:00:00.000Z",
+        "job_min_salary": None,
+        "job_max_salary": None,
+        "job_salary_currency": None,
+    }
+    if rng.random() < 0.4:
+        low = rng.randint(3, 20) * 100000
+        item.update(job_min_salary=low, job_max_salary=low + rng.randint(1, 10) * 100000, job_salary_currency="INR")
+    if rng.random() < 0.8:
+        item["job_description"] = _description(rng, skills)
+    else:
+        item["job_description"] = ""
+        item["job_highlights"] = {
+            "Qualifications": [f"Experience with {s}" for s in skills],
+            "Responsibilities": [" ".join(rng.choices(FILLER, k=12)) for _ in range(rng.randint(1, 5))],
+        }
+    return item
+
+
+def rapidapi_jobs(n, seed=0):
+    rng = random.Random(seed)
+    return [rapidapi_job(rng, i) for i in range(n)]
+
+
+def resume(rng):
+    skills = rng.sample(SKILLS, rng.randint(4, 12)) + rng.sample(SOFT_SKILLS + TOPICS, rng.randint(1, 4))
+    projects = rng.sample(PROJECTS, rng.randint(1, 4))
+    return (
+        "Education: B.E. Computer Science, Canara Engineering College\n"
+        f"Skills: {', '.join(skills)}\n"
+        f"Projects: {'; '.join(projects)}\n"
+        + " ".join(rng.choices(FILLER, k=rng.randint(80, 300)))
+    )
+
+
+def resumes(n, seed=0):
+    rng = random.Random(seed)
+    return [resume(rng) for _ in range(n)]
+
+
+def user_profile(rng, i):
+    return {
+        "id": f"u{i}",
+        "name": f"Student {i}",
+        "skills": [s.lower() for s in rng.sample(SKILLS, rng.randint(2, 8))],
+        "projects": rng.sample(PROJECTS, rng.randint(1, 3)),
+        "certifications": rng.sample(CERTIFICATIONS, rng.randint(0, 2)),
+    }
+
+
+def user_profiles(n, seed=0):
+    rng = random.Random(seed)
+    return [user_profile(rng, i) for i in range(n)]
+
+
+def _typo(rng, word):
+    if len(word) < 3:
+        return word
+    i = rng.randrange(len(word) - 1)
+    kind = rng.choice(["swap", "drop", "double", "replace"])
+    if kind == "swap":
+        return word[:i] + word[i + 1] + word[i] + word[i + 2:]
+    if kind == "drop":
+        return word[:i] + word[i + 1:]
+    if kind == "double":
+        return word[:i] + word[i] + word[i:]
+    return word[:i] + rng.choice("abcdefghijklmnopqrstuvwxyz") + word[i + 1:]
+
+
+def chat_queries(n, questions, seed=0, typo_rate=0.15):
+    """FAQ questions rephrased with random typos, the way students actually type them."""
+    rng = random.Random(seed)
+    queries = []
+    for _ in range(n):
+        words = rng.choice(questions).split()
+        queries.append(" ".join(_typo(rng, w) if rng.random() < typo_rate else w for w in words))
+    return queries
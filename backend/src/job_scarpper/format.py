@@ -1,7 +1,58 @@
-from flask import Flask, jsonify
+from flask import Flask, Response, jsonify, request, stream_with_context
 import json
+import os
+import threading
+import time
+
+from job_matching import extract_text_from_pdf, stream_top_ats, top_ats
+from opportunity_store import OpportunityStore
 
 app = Flask(__name__)
+app.config["MAX_CONTENT_LENGTH"] = 5 * 1024 * 1024  # resume uploads
+store = OpportunityStore()
+
+MAX_LIMIT = 500
+ATS_DEFAULT_K = 10
+ATS_MAX_K = 100
+RESIDENT_RELOAD_SECONDS = 300
+ATS_FIELDS = ("title", "company", "apply_link", "skills", "good_to_have", "topics", "buzzwords")
+
+# One-time migration: seed the store from the legacy JSON files
+for legacy_file, category in (("jobs.json", "job"), ("internships.json", "internship")):
+    if os.path.exists(legacy_file) and store.count(category) == 0:
+        store.import_json(legacy_file, category)
+
+
+class ResidentJobs:
+    """The ATS fields of every job, kept in memory and reloaded when the store changes."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._jobs = []
+        self._version = None
+        self._loaded_at = 0
+
+    def get(self):
+        version = store.version()
+        stale = time.monotonic() - self._loaded_at > RESIDENT_RELOAD_SECONDS
+        if version != self._version or stale:
+            with self._lock:
+                if version != self._version or stale:
+                    self._jobs = [
+                        {f: job[f] for f in ATS_FIELDS} for job in store.iter_all(category="job")
+                    ]
+                    self._version = version
+                    self._loaded_at = time.monotonic()
+        return self._jobs
+
+
+resident_jobs = ResidentJobs()
+
+
+def _page_args(default_limit):
+    limit = min(request.args.get("limit", default_limit, type=int), MAX_LIMIT)
+    offset = max(request.args.get("offset", 0, type=int), 0)
+    return max(limit, 0), offset
 
 @app.route("/")
 def home():
@@ -9,21 +60,64 @@ def home():
         "message": "Welcome to the CEC Hub API 🚀",
         "endpoints": {
             "jobs": "/jobs",
-            "internships": "/internships"
+            "internships": "/internships",
+            "search": "/jobs/search?q=",
+            "ats": "POST /jobs/ats"
         }
     }
 
 @app.route("/jobs")
 def get_jobs():
-    with open("jobs.json", "r") as f:
-        jobs = json.load(f)
-    return jsonify(jobs)
+    limit, offset = _page_args(100)
+    return jsonify(store.recent("job", limit, offset))
 
 @app.route("/internships")
 def get_internships():
-    with open("internships.json", "r") as f:
-        internships = json.load(f)
-    return jsonify(internships)
+    limit, offset = _page_args(100)
+    return jsonify(store.recent("internship", limit, offset))
+
+@app.route("/jobs/search")
+def search_jobs():
+    query = request.args.get("q", "").strip()
+    if not query:
+        return jsonify({"error": "Missing query parameter 'q'"}), 400
+    limit, offset = _page_args(20)
+    filters = {
+        "category": request.args.get("category"),
+        "company": request.args.get("company"),
+        "location": request.args.get("location"),
+        "employment_type": request.args.get("employment_type"),
+        "remote": request.args.get("remote"),
+    }
+    results = store.search(query, limit, offset, **filters)
+    return jsonify({"query": query, "count": len(results), "results": results})
+
+@app.route("/jobs/ats", methods=["POST"])
+def ats_jobs():
+    """Top-k ATS matches for an uploaded resume (PDF field 'resume' or text field 'resume_text').
+
+    With ?stream=1 the response is NDJSON: one line per job as it enters the
+    running top-k, then a final line with the ranked top-k.
+    """
+    upload = request.files.get("resume")
+    resume_text = extract_text_from_pdf(upload.stream) if upload else request.form.get("resume_text", "")
+    if not resume_text.strip():
+        return jsonify({"error": "Upload a PDF as 'resume' or send 'resume_text'"}), 400
+    k = max(1, min(request.args.get("k", ATS_DEFAULT_K, type=int), ATS_MAX_K))
+    jobs = resident_jobs.get()
+
+    if request.args.get("stream") in ("1", "true"):
+        def generate():
+            for kind, payload in stream_top_ats(resume_text, jobs, k):
+                if kind == "candidate":
+                    yield json.dumps({"type": "candidate", "result": payload}) + "\n"
+                else:
+                    yield json.dumps({"type": "top", "results": payload}) + "\n"
+
+        return Response(stream_with_context(generate()), mimetype="application/x-ndjson")
+
+    results = top_ats(resume_text, jobs, k)
+    return jsonify({"scored": len(jobs), "k": k, "results": results})
 
 if __name__ == "__main__":
     app.run(debug=True)
@@ -1,79 +1,4 @@
-# from sklearn.feature_extraction.text import TfidfVectorizer
-# from sklearn.metrics.pairwise import cosine_similarity
-# import pandas as pd
-
-
-# users = [
-#     {
-#         "id": "u123",
-#         "name": "Mohith",
-#         "skills": ["python", "machine learning", "ai"],
-#         "projects": ["chatbot", "recommendation system"],
-#         "certifications": ["AWS", "TensorFlow"]
-#     },
-#     {
-#         "id": "u124",
-#         "name": "Alice",
-#         "skills": ["python", "data science"],
-#         "projects": ["portfolio website"],
-#         "certifications": ["Azure"]
-#     },
-# ]
-
-
-# jobs = [
-#     {
-#         "id": "j101",
-#         "title": "AI Engineer",
-#         "requirements": ["python", "machine learning", "deep learning", "TensorFlow"]
-#     },
-#     {
-#         "id": "j102",
-#         "title": "Data Analyst",
-#         "requirements": ["python", "sql", "data visualization"]
-#     },
-#     {
-#         "id": "j103",
-#         "title": "Backend Developer",
-#         "requirements": ["java", "spring boot", "mysql"]
-#     }
-# ]
-
-
-# def profile_to_text(user):
-#     return " ".join(user["skills"] + user["projects"] + user["certifications"])
-
-
-# def job_to_text(job):
-#     return " ".join(job["requirements"])
-
-
-# def recommend_jobs(user_id, top_n=3):
-   
-#     user = next((u for u in users if u["id"] == user_id), None)
-#     if not user:
-#         return "User not found"
-    
-#     user_text = profile_to_text(user)
-#     job_texts = [job_to_text(j) for j in jobs]
-
-#     vectorizer = TfidfVectorizer()
-#     tfidf_matrix = vectorizer.fit_transform([user_text] + job_texts)
-
-#     similarity_scores = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:]).flatten()
-
-#     ranked_jobs = sorted(
-#         list(zip(jobs, similarity_scores)),
-#         key=lambda x: x[1],
-#         reverse=True
-#     )[:top_n]
-
-#     return [(job["title"], round(score, 2)) for job, score in ranked_jobs]
-
-
-# print("Job Recommendations for Mohith:")
-# print(recommend_jobs("u123"))
-
+import heapq
 import json
 import re
 from PyPDF2 import PdfReader
@@ -126,8 +51,43 @@ def calculate_ats_score(resume_text, job):
 
     return round((matched_keywords / total_keywords) * 100, 2)
 
+# ---------------- Top-k Matching ----------------
+def ats_result(job, score):
+    return {
+        "title": job["title"],
+        "company": job["company"],
+        "score": score,
+        "apply_link": job["apply_link"]
+    }
+
+def stream_top_ats(resume_text, jobs, k=10):
+    """Score jobs while keeping only a bounded min-heap of the best k.
+
+    Yields ("candidate", result) whenever a job enters the current top k, then
+    ("top", results) with the final top k, best first.
+    """
+    heap = []
+    for seq, job in enumerate(jobs):
+        score = calculate_ats_score(resume_text, job)
+        entry = (score, -seq, job)
+        if len(heap) < k:
+            heapq.heappush(heap, entry)
+        elif entry > heap[0]:
+            heapq.heapreplace(heap, entry)
+        else:
+            continue
+        yield "candidate", ats_result(job, score)
+
+    yield "top", [ats_result(job, score) for score, _, job in sorted(heap, reverse=True)]
+
+def top_ats(resume_text, jobs, k=10):
+    for kind, payload in stream_top_ats(resume_text, jobs, k):
+        if kind == "top":
+            return payload
+    return []
+
 # ---------------- Main ----------------
-def run_ats(resume_path, jobs_file="jobs_output.json"):
+def run_ats(resume_path, jobs_file="jobs_output.json", top_k=None):
     # Load resume text
     resume_text = extract_text_from_pdf(resume_path)
     if not resume_text:
@@ -141,16 +101,11 @@ def run_ats(resume_path, jobs_file="jobs_output.json"):
         print(f"❌ Error reading jobs file: {e}")
         return
 
-    # Calculate ATS scores
-    results = []
-    for job in jobs:
-        score = calculate_ats_score(resume_text, job)
-        results.append({
-            "title": job["title"],
-            "company": job["company"],
-            "score": score,
-            "apply_link": job["apply_link"]
-        })
+    # Calculate ATS scores (only the best top_k are kept when given)
+    if top_k:
+        results = top_ats(resume_text, jobs, top_k)
+    else:
+        results = [ats_result(job, calculate_ats_score(resume_text, job)) for job in jobs]
 
     # Print results
     print("\n📊 ATS Score Results:\n")
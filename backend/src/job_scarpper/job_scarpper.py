@@ -1,8 +1,15 @@
 import requests
 import re
 import os
+import json
+import threading
+import time
+from collections import OrderedDict
 from dotenv import load_dotenv
 
+from opportunity_store import OpportunityStore
+from run_report import NULL_REPORT, RunReport
+
 
 load_dotenv()
 API_KEY = (os.getenv("API_KEY") or "").strip()
@@ -11,9 +18,57 @@ if not API_KEY:
     raise SystemExit(0)
 
 RAPIDAPI_HOST = "jsearch.p.rapidapi.com"
-SEEN_JOB_IDS = set()
+# job_id -> when it was claimed, oldest first; the daemon keeps this across cycles
+SEEN_JOB_IDS = OrderedDict()
+SEEN_TTL_SECONDS = 7 * 24 * 3600
+SEEN_MAX_IDS = 100_000
+_seen_lock = threading.Lock()  # scheduler workers share SEEN_JOB_IDS
 BACKEND_URL = (os.getenv("BACKEND_URL") or os.getenv("API_BASE_URL") ).rstrip("/")
 SCRAPER_TOKEN = (os.getenv("SCRAPER_TOKEN") or "").strip()
+FETCH_RETRIES = 2
+REPORT_PATH = os.getenv("SCRAPER_REPORT_PATH") or "scraper_run_report.json"
+PROMETHEUS_PATH = os.getenv("SCRAPER_PROMETHEUS_PATH")  # e.g. /var/lib/node_exporter/textfile/job_scraper.prom
+opportunity_store = OpportunityStore()
+# Embedding new postings pulls in sentence-transformers, so it is opt-in
+SEMANTIC_INDEX_ENABLED = (os.getenv("ENABLE_SEMANTIC_INDEX") or "").strip().lower() == "true"
+_semantic_index = None
+_semantic_lock = threading.Lock()  # one builder/sync at a time, or rows get added and written twice
+
+
+def claim_job_id(job_id):
+    """Mark a job id as seen. Returns False if it was already seen recently."""
+    now = time.monotonic()
+    with _seen_lock:
+        while SEEN_JOB_IDS:
+            oldest, seen_at = next(iter(SEEN_JOB_IDS.items()))
+            if len(SEEN_JOB_IDS) < SEEN_MAX_IDS and now - seen_at < SEEN_TTL_SECONDS:
+                break
+            del SEEN_JOB_IDS[oldest]
+        if job_id in SEEN_JOB_IDS:
+            return False
+        SEEN_JOB_IDS[job_id] = now
+        return True
+
+
+def release_job_ids(job_ids):
+    """Forget job ids whose upload failed so the next cycle sends them again."""
+    with _seen_lock:
+        for job_id in job_ids:
+            SEEN_JOB_IDS.pop(job_id, None)
+
+
+def update_semantic_index():
+    """Embed postings added to the store since the last run into the FAISS index."""
+    global _semantic_index
+    try:
+        with _semantic_lock:
+            if _semantic_index is None:
+                from semantic_matching import SemanticJobIndex
+                _semantic_index = SemanticJobIndex(opportunity_store)
+            added = _semantic_index.sync()
+        print(f"🧠 Added {added} postings to the semantic index")
+    except Exception as e:
+        print(f"❌ Error updating semantic index: {e}")
 
 
 def extract_details_from_description(desc):
@@ -60,7 +115,7 @@ def extract_details_from_description(desc):
 
 
 
-def get_opportunities(query: str, num_pages: int = 1, location: str = "India"):
+def get_opportunities(query: str, num_pages: int = 1, location: str = "India", page: int = 1, report=NULL_REPORT, session=requests):
     url = f"https://{RAPIDAPI_HOST}/search"
     headers = {
         "X-RapidAPI-Key": API_KEY,
@@ -68,21 +123,36 @@ def get_opportunities(query: str, num_pages: int = 1, location: str = "India"):
     }
     params = {
         "query": query,
-        "page": "1",
+        "page": str(page),
         "num_pages": str(num_pages),
         "country": "in",  
         "location": location
     }
-    try:
-        response = requests.get(url, headers=headers, params=params)
-        response.raise_for_status()
-        data = response.json()
-        jobs = data.get("data", [])
-        print(f"📊 API returned {len(jobs)} jobs for query='{query}' in location='{location}'")
-        return jobs
-    except Exception as e:
-        print(f"❌ Error fetching jobs: {e}")
-        return []
+    for attempt in range(FETCH_RETRIES + 1):
+        try:
+            with report.stage("fetch", query, page):
+                response = session.get(url, headers=headers, params=params)
+                report.count("requests", 1, query, page)
+                report.count("bytes_fetched", len(response.content), query, page)
+                # rate limits and server errors are worth another try
+                retry = attempt < FETCH_RETRIES and (response.status_code == 429 or response.status_code >= 500)
+                if not retry:
+                    response.raise_for_status()
+                    data = response.json()
+            if retry:
+                report.count("retries", 1, query, page)
+                with report.stage("backoff", query, page):
+                    time.sleep(2 ** attempt)
+                continue
+            jobs = data.get("data", [])
+            report.count("items_fetched", len(jobs), query, page)
+            print(f"📊 API returned {len(jobs)} jobs for query='{query}' in location='{location}'")
+            return jobs
+        except Exception as e:
+            report.count("fetch_errors", 1, query, page)
+            print(f"❌ Error fetching jobs: {e}")
+            return []
+    return []
 
 
 def _compose_description(item: dict) -> str:
@@ -104,7 +174,7 @@ def _compose_description(item: dict) -> str:
     return "\n".join(lines).strip()
 
 
-def build_opportunity(item: dict) -> dict:
+def build_opportunity(item: dict, report=NULL_REPORT, query=None, page=None) -> dict:
     """Map RapidAPI job item to our Opportunity schema payload."""
     job_id = item.get("job_id")
     title = item.get("job_title", "N/A")
@@ -128,7 +198,8 @@ def build_opportunity(item: dict) -> dict:
         salary = (range_part + (f" {currency}" if currency else "")).strip()
 
     description = _compose_description(item)
-    details = extract_details_from_description(description or "")
+    with report.stage("extract", query, page):
+        details = extract_details_from_description(description or "")
 
     return {
         "job_id": job_id,
@@ -150,7 +221,7 @@ def build_opportunity(item: dict) -> dict:
     }
 
 
-def send_to_backend(items: list) -> bool:
+def send_to_backend(items: list, report=NULL_REPORT, query=None, session=requests) -> bool:
     """Bulk upsert opportunities into the Node backend."""
     if not items:
         print("ℹ️ No new items to send to backend.")
@@ -160,65 +231,93 @@ def send_to_backend(items: list) -> bool:
         return False
     url = f"{BACKEND_URL}/api/v1/opportunities/bulk"
     try:
-        resp = requests.post(
-            url,
-            json={"items": items},
-            headers={
-                "X-Internal-Token": SCRAPER_TOKEN,
-                "Content-Type": "application/json",
-            },
-            timeout=30,
-        )
+        body = json.dumps({"items": items})
+        with report.stage("upload", query):
+            resp = session.post(
+                url,
+                data=body,
+                headers={
+                    "X-Internal-Token": SCRAPER_TOKEN,
+                    "Content-Type": "application/json",
+                },
+                timeout=30,
+            )
+        report.count("bytes_uploaded", len(body), query)
         ok = 200 <= resp.status_code < 300
+        report.count("items_uploaded" if ok else "upload_failures", len(items) if ok else 1, query)
         preview = resp.text[:300].replace("\n", " ")
         print(f"⬆️ Sent {len(items)} items to backend -> {resp.status_code} {preview}")
         return ok
     except Exception as e:
+        report.count("upload_failures", 1, query)
         print(f"❌ Error posting to backend: {e}")
         return False
 
 
-def run_job_checker():
-    queries = ["full stack developer"]
+def run_job_checker(queries=None, num_pages=1, location="India", report=None, session=requests,
+                    report_path=REPORT_PATH, prometheus_path=PROMETHEUS_PATH):
+    queries = queries or ["full stack developer"]
+    report = report or RunReport()
 
     for query in queries:
         print(f"\n🔍 Searching jobs for: {query}\n")
-        jobs = get_opportunities(query, num_pages=1, location="India")
-
-        if not jobs:
-            print("⚠️ No results found.")
-            continue
-
         items_to_send = []
-        for item in jobs:
-            job_id = item.get("job_id")
-            if not job_id or job_id in SEEN_JOB_IDS:
-                continue
-            SEEN_JOB_IDS.add(job_id)
-
-            # Pretty print to terminal
-            job_title = item.get("job_title", "N/A")
-            company = item.get("employer_name", "N/A")
-            loc_city = item.get("job_city") or ""
-            loc_country = item.get("job_country") or "N/A"
-            loc_display = ", ".join([p for p in [loc_city, loc_country] if p]) or loc_country
-            remote = "Yes" if item.get("job_is_remote", False) else "No"
-            apply_link = item.get("job_apply_link") or item.get("job_google_link") or "#"
-
-            # print(f"✅ {job_title} @ {company}")
-            # print(f"   📍 Location: {loc_display} | Remote: {remote}")
-            # print(f"   🔗 Apply here: {apply_link}\n")
-
-          
-            mapped = build_opportunity(item)
-            if mapped.get("job_id"):
-                items_to_send.append(mapped)
-
-   
+        for page in range(1, num_pages + 1):
+            jobs = get_opportunities(query, num_pages=1, location=location, page=page, report=report, session=session)
+
+            if not jobs:
+                print("⚠️ No results found.")
+                break
+
+            for item in jobs:
+                with report.stage("dedup", query, page):
+                    job_id = item.get("job_id")
+                    if not job_id or not claim_job_id(job_id):
+                        report.count("duplicates", 1, query, page)
+                        continue
+
+                # Pretty print to terminal
+                job_title = item.get("job_title", "N/A")
+                company = item.get("employer_name", "N/A")
+                loc_city = item.get("job_city") or ""
+                loc_country = item.get("job_country") or "N/A"
+                loc_display = ", ".join([p for p in [loc_city, loc_country] if p]) or loc_country
+                remote = "Yes" if item.get("job_is_remote", False) else "No"
+                apply_link = item.get("job_apply_link") or item.get("job_google_link") or "#"
+
+                # print(f"✅ {job_title} @ {company}")
+                # print(f"   📍 Location: {loc_display} | Remote: {remote}")
+                # print(f"   🔗 Apply here: {apply_link}\n")
+
+                with report.stage("map", query, page):
+                    mapped = build_opportunity(item, report, query, page)
+                if mapped.get("job_id"):
+                    items_to_send.append(mapped)
+                    report.count("items_mapped", 1, query, page)
+
         if items_to_send:
-            ok = send_to_backend(items_to_send)
-            if not ok:
-                print("⚠️ Backend upsert failed; items were not persisted.")
+            ok = False
+            try:
+                with report.stage("store", query):
+                    saved = opportunity_store.upsert_many(items_to_send)
+                print(f"💾 Saved {saved} items to local opportunity store")
+                if SEMANTIC_INDEX_ENABLED:
+                    with report.stage("semantic_index", query):
+                        update_semantic_index()
+                ok = send_to_backend(items_to_send, report, query, session)
+            finally:
+                if not ok:
+                    # only uploaded postings count as seen, so the next run sends these again
+                    release_job_ids(i["job_id"] for i in items_to_send)
+                    print("⚠️ Backend upsert failed; items will be retried on the next run.")
+
+    report.finish()
+    print(f"📈 Run report: {report.summary()}")
+    if report_path:
+        report.write_json(report_path)
+    if prometheus_path:
+        report.write_prometheus(prometheus_path)
+    return report
 
 
 if __name__ == "__main__":
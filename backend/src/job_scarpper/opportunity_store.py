@@ -0,0 +1,214 @@
+import json
+import os
+import sqlite3
+import sys
+import threading
+
+
+DB_PATH = os.getenv("OPPORTUNITY_DB") or os.path.join(os.path.dirname(__file__), "opportunities.sqlite3")
+
+# Columns produced by build_opportunity(); list fields are stored as JSON text
+COLUMNS = [
+    "job_id", "title", "company", "location", "employment_type", "remote", "salary", "posted_on",
+    "skills", "good_to_have", "topics", "buzzwords", "rounds", "cutoff", "apply_link", "description",
+]
+LIST_COLUMNS = {"skills", "good_to_have", "topics", "buzzwords"}
+FILTER_COLUMNS = {"company", "location", "employment_type", "remote", "category"}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS opportunities (
+    id INTEGER PRIMARY KEY,
+    job_id TEXT NOT NULL UNIQUE,
+    category TEXT NOT NULL DEFAULT 'job',
+    title TEXT,
+    company TEXT,
+    location TEXT,
+    employment_type TEXT,
+    remote TEXT,
+    salary TEXT,
+    posted_on TEXT,
+    skills TEXT,
+    good_to_have TEXT,
+    topics TEXT,
+    buzzwords TEXT,
+    rounds TEXT,
+    cutoff TEXT,
+    apply_link TEXT,
+    description TEXT
+);
+CREATE INDEX IF NOT EXISTS opportunities_category ON opportunities (category, posted_on);
+CREATE INDEX IF NOT EXISTS opportunities_company ON opportunities (company);
+CREATE INDEX IF NOT EXISTS opportunities_location ON opportunities (location);
+CREATE INDEX IF NOT EXISTS opportunities_employment_type ON opportunities (employment_type);
+CREATE INDEX IF NOT EXISTS opportunities_remote ON opportunities (remote);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS opportunities_fts USING fts5(
+    title, company, description,
+    content='opportunities', content_rowid='id', tokenize='porter unicode61'
+);
+CREATE TRIGGER IF NOT EXISTS opportunities_ai AFTER INSERT ON opportunities BEGIN
+    INSERT INTO opportunities_fts (rowid, title, company, description)
+    VALUES (new.id, new.title, new.company, new.description);
+END;
+CREATE TRIGGER IF NOT EXISTS opportunities_ad AFTER DELETE ON opportunities BEGIN
+    INSERT INTO opportunities_fts (opportunities_fts, rowid, title, company, description)
+    VALUES ('delete', old.id, old.title, old.company, old.description);
+END;
+CREATE TRIGGER IF NOT EXISTS opportunities_au AFTER UPDATE ON opportunities BEGIN
+    INSERT INTO opportunities_fts (opportunities_fts, rowid, title, company, description)
+    VALUES ('delete', old.id, old.title, old.company, old.description);
+    INSERT INTO opportunities_fts (rowid, title, company, description)
+    VALUES (new.id, new.title, new.company, new.description);
+END;
+"""
+
+# bm25 column weights for title, company, description
+RANK = "bm25(opportunities_fts, 10.0, 5.0, 1.0)"
+
+
+def _to_fts_query(text):
+    """Turn free text into an FTS5 query: every word must match, the last one as a prefix."""
+    terms = [t.replace('"', '""') for t in text.split()]
+    if not terms:
+        return None
+    quoted = [f'"{t}"' for t in terms]
+    quoted[-1] += "*"
+    return " ".join(quoted)
+
+
+def _row_to_dict(row):
+    item = dict(row)
+    for column in LIST_COLUMNS:
+        item[column] = json.loads(item[column]) if item.get(column) else []
+    return item
+
+
+class OpportunityStore:
+    """SQLite store for scraped opportunities with an FTS5 index over title/company/description."""
+
+    def __init__(self, path=DB_PATH):
+        self.path = path
+        self._local = threading.local()
+        self.conn.executescript(SCHEMA)
+
+    @property
+    def conn(self):
+        # one connection per thread; Flask may serve requests from several threads
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    # ---------------- Writes ----------------
+    def upsert_many(self, items, category="job"):
+        """Insert or update opportunities by job_id. Returns the number of rows written."""
+        rows = []
+        for item in items:
+            if not item.get("job_id"):
+                continue
+            values = [
+                json.dumps(item.get(c) or []) if c in LIST_COLUMNS else item.get(c)
+                for c in COLUMNS
+            ]
+            rows.append(values + [category])
+        if not rows:
+            return 0
+
+        columns = ", ".join(COLUMNS + ["category"])
+        placeholders = ", ".join("?" for _ in range(len(COLUMNS) + 1))
+        updates = ", ".join(f"{c} = excluded.{c}" for c in COLUMNS[1:] + ["category"])
+        with self.conn:
+            self.conn.executemany(
+                f"INSERT INTO opportunities ({columns}) VALUES ({placeholders}) "
+                f"ON CONFLICT(job_id) DO UPDATE SET {updates}",
+                rows,
+            )
+        return len(rows)
+
+    def import_json(self, json_path, category="job"):
+        with open(json_path, "r", encoding="utf-8") as f:
+            return self.upsert_many(json.load(f), category)
+
+    # ---------------- Reads ----------------
+    def count(self, category=None):
+        if category is None:
+            return self.conn.execute("SELECT COUNT(*) FROM opportunities").fetchone()[0]
+        return self.conn.execute(
+            "SELECT COUNT(*) FROM opportunities WHERE category = ?", (category,)
+        ).fetchone()[0]
+
+    def version(self):
+        """Cheap change marker (row count, highest id) for callers that cache postings."""
+        return tuple(self.conn.execute("SELECT COUNT(*), MAX(id) FROM opportunities").fetchone())
+
+    def recent(self, category="job", limit=100, offset=0):
+        rows = self.conn.execute(
+            "SELECT * FROM opportunities WHERE category = ? ORDER BY posted_on DESC, id DESC LIMIT ? OFFSET ?",
+            (category, limit, offset),
+        )
+        return [_row_to_dict(r) for r in rows]
+
+    def get_many(self, ids):
+        """Fetch opportunities by row id, returned as {id: opportunity}."""
+        ids = [int(i) for i in ids]
+        if not ids:
+            return {}
+        placeholders = ", ".join("?" for _ in ids)
+        rows = self.conn.execute(f"SELECT * FROM opportunities WHERE id IN ({placeholders})", ids)
+        return {r["id"]: _row_to_dict(r) for r in rows}
+
+    def ids_after(self, last_id, batch_size=1000):
+        """Row ids and embedding text for postings added after last_id, oldest first."""
+        return self.conn.execute(
+            "SELECT id, title, description FROM opportunities WHERE id > ? ORDER BY id LIMIT ?",
+            (last_id, batch_size),
+        ).fetchall()
+
+    def iter_all(self, category=None, batch_size=1000):
+        """Yield every opportunity without loading the whole table at once."""
+        query = "SELECT * FROM opportunities"
+        params = ()
+        if category is not None:
+            query += " WHERE category = ?"
+            params = (category,)
+        cursor = self.conn.execute(query, params)
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                return
+            for row in rows:
+                yield _row_to_dict(row)
+
+    def search(self, text, limit=20, offset=0, **filters):
+        """Full-text search ranked by bm25; filters match FILTER_COLUMNS exactly."""
+        match = _to_fts_query(text or "")
+        if match is None:
+            return []
+        where = ["opportunities_fts MATCH ?"]
+        params = [match]
+        for column, value in filters.items():
+            if column not in FILTER_COLUMNS:
+                raise ValueError(f"Unknown filter: {column}")
+            if value is not None:
+                where.append(f"o.{column} = ?")
+                params.append(value)
+        rows = self.conn.execute(
+            f"SELECT o.*, {RANK} AS rank FROM opportunities_fts "
+            f"JOIN opportunities o ON o.id = opportunities_fts.rowid "
+            f"WHERE {' AND '.join(where)} ORDER BY rank LIMIT ? OFFSET ?",
+            params + [limit, offset],
+        )
+        return [_row_to_dict(r) for r in rows]
+
+
+if __name__ == "__main__":
+    # usage: python opportunity_store.py import <file.json> [job|internship]
+    if len(sys.argv) >= 3 and sys.argv[1] == "import":
+        category = sys.argv[3] if len(sys.argv) > 3 else "job"
+        written = OpportunityStore().import_json(sys.argv[2], category)
+        print(f"✅ Imported {written} {category} postings from {sys.argv[2]}")
+    else:
+        print("usage: python opportunity_store.py import <file.json> [job|internship]")
@@ -0,0 +1,146 @@
+import json
+import os
+import threading
+import time
+import uuid
+from collections import defaultdict
+from contextlib import contextmanager
+
+
+class RunReport:
+    """Per-stage timings and counters for one scraper run.
+
+    Stages are timed exclusively: when stages nest (extract inside map), the
+    inner stage's time is not counted again in the outer one, so the stage
+    totals add up to the time spent in instrumented code. Every stage and
+    counter is recorded per query and page.
+    """
+
+    def __init__(self, name="job_scraper", labels=None):
+        self.name = name
+        self.labels = labels or {}
+        self.run_id = uuid.uuid4().hex
+        self.started_at = time.time()
+        self.finished_at = None
+        self._start = time.perf_counter()
+        self._end = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.stages = defaultdict(lambda: {"seconds": 0.0, "calls": 0})
+        self.counters = defaultdict(float)
+
+    @contextmanager
+    def stage(self, name, query=None, page=None):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        frame = {"child_seconds": 0.0}
+        stack.append(frame)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            stack.pop()
+            if stack:
+                stack[-1]["child_seconds"] += elapsed
+            with self._lock:
+                entry = self.stages[(query, page, name)]
+                entry["seconds"] += elapsed - frame["child_seconds"]
+                entry["calls"] += 1
+
+    def count(self, name, value=1, query=None, page=None):
+        with self._lock:
+            self.counters[(query, page, name)] += value
+
+    def finish(self):
+        self.finished_at = time.time()
+        self._end = time.perf_counter()
+        return self
+
+    # ---------------- Output ----------------
+    def to_dict(self):
+        with self._lock:
+            stages = [
+                {"query": q, "page": p, "stage": s, "seconds": round(v["seconds"], 6), "calls": v["calls"]}
+                for (q, p, s), v in self.stages.items()
+            ]
+            counters = [
+                {"query": q, "page": p, "counter": c, "value": v}
+                for (q, p, c), v in self.counters.items()
+            ]
+        stage_totals = defaultdict(float)
+        for s in stages:
+            stage_totals[s["stage"]] += s["seconds"]
+        counter_totals = defaultdict(float)
+        for c in counters:
+            counter_totals[c["counter"]] += c["value"]
+
+        return {
+            "name": self.name,
+            "run_id": self.run_id,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "labels": self.labels,
+            "duration_seconds": round((self._end or time.perf_counter()) - self._start, 6),
+            "stage_totals": {k: round(v, 6) for k, v in stage_totals.items()},
+            "counter_totals": dict(counter_totals),
+            "stages": stages,
+            "counters": counters,
+        }
+
+    def write_json(self, path):
+        _write_atomic(path, json.dumps(self.to_dict(), indent=2))
+
+    def write_prometheus(self, path):
+        """Write totals in the node_exporter textfile collector format."""
+        report = self.to_dict()
+        prefix = self.name
+        extra = "".join(f',{k}="{v}"' for k, v in self.labels.items())
+        plain = "{" + extra.lstrip(",") + "}" if extra else ""
+        lines = [
+            f"# HELP {prefix}_stage_seconds Time spent per scraper stage in the last run.",
+            f"# TYPE {prefix}_stage_seconds gauge",
+        ]
+        lines += [f'{prefix}_stage_seconds{{stage="{s}"{extra}}} {v}' for s, v in report["stage_totals"].items()]
+        lines += [
+            f"# HELP {prefix}_last_run_count Items, bytes and retries counted in the last run.",
+            f"# TYPE {prefix}_last_run_count gauge",
+        ]
+        lines += [f'{prefix}_last_run_count{{counter="{c}"{extra}}} {v}' for c, v in report["counter_totals"].items()]
+        lines += [
+            f"# HELP {prefix}_last_run_duration_seconds Wall time of the last run.",
+            f"# TYPE {prefix}_last_run_duration_seconds gauge",
+            f"{prefix}_last_run_duration_seconds{plain} {report['duration_seconds']}",
+            f"# HELP {prefix}_last_run_timestamp_seconds When the last run finished.",
+            f"# TYPE {prefix}_last_run_timestamp_seconds gauge",
+            f"{prefix}_last_run_timestamp_seconds{plain} {report['finished_at'] or time.time()}",
+        ]
+        _write_atomic(path, "\n".join(lines) + "\n")
+
+    def summary(self):
+        report = self.to_dict()
+        stages = ", ".join(f"{s} {v:.2f}s" for s, v in report["stage_totals"].items())
+        counters = ", ".join(f"{c}={v:g}" for c, v in report["counter_totals"].items())
+        return f"{report['duration_seconds']:.2f}s total | {stages} | {counters}"
+
+
+class NullReport:
+    """Stand-in used when a caller does not collect a report."""
+
+    @contextmanager
+    def stage(self, name, query=None, page=None):
+        yield
+
+    def count(self, name, value=1, query=None, page=None):
+        pass
+
+
+NULL_REPORT = NullReport()
+
+
+def _write_atomic(path, text):
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp, path)
@@ -0,0 +1,182 @@
+import heapq
+import json
+import os
+import random
+import re
+import signal
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+import requests
+
+from job_scarpper import PROMETHEUS_PATH, RAPIDAPI_HOST, REPORT_PATH, run_job_checker
+from run_report import RunReport
+
+
+CONFIG_PATH = os.getenv("SCRAPER_CONFIG") or os.path.join(os.path.dirname(__file__), "scraper_config.json")
+DEFAULTS = {
+    "workers": 2,                 # scraper jobs running at once
+    "max_pending": 4,             # due jobs allowed to wait for a worker before new ones are postponed
+    "rate_limit_per_minute": 10,  # RapidAPI requests across all workers
+    "jitter_seconds": 30,
+    "retry_busy_seconds": 15,     # how long a due job is postponed when the pool is saturated
+}
+JOB_DEFAULTS = {
+    "location": "India",
+    "num_pages": 1,
+    "interval_minutes": 60,
+}
+
+
+def load_config(path=CONFIG_PATH):
+    with open(path, "r", encoding="utf-8") as f:
+        config = json.load(f)
+    merged = {**DEFAULTS, **{k: v for k, v in config.items() if k != "jobs"}}
+    merged["jobs"] = [{**JOB_DEFAULTS, **job} for job in config.get("jobs", [])]
+    if not merged["jobs"]:
+        raise ValueError(f"No jobs configured in {path}")
+    return merged
+
+
+class TokenBucket:
+    """Blocking rate limiter shared by every worker."""
+
+    def __init__(self, rate_per_minute, burst=None):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = burst or max(1, int(rate_per_minute // 6) or 1)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class RateLimitedSession(requests.Session):
+    """Keep-alive session that takes a token before every RapidAPI request."""
+
+    def __init__(self, bucket):
+        super().__init__()
+        self.bucket = bucket
+
+    def request(self, method, url, *args, **kwargs):
+        if urlparse(url).hostname == RAPIDAPI_HOST:
+            self.bucket.acquire()
+        return super().request(method, url, *args, **kwargs)
+
+
+def _slug(text):
+    return re.sub(r"[^a-z0-9]+", "_", text.lower()).strip("_")
+
+
+class ScraperDaemon:
+    """Runs configured scraper jobs on their own intervals in one long-lived process.
+
+    Start-up, .env loading and SEEN_JOB_IDS happen once. Worker threads keep
+    their keep-alive sessions and store connections between cycles. When all
+    workers are busy and max_pending jobs are already waiting, new due jobs are
+    postponed. On SIGTERM/SIGINT nothing new is dispatched, queued jobs are
+    dropped and running jobs, including their uploads, are allowed to finish.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.bucket = TokenBucket(config["rate_limit_per_minute"])
+        self.pool = ThreadPoolExecutor(max_workers=config["workers"], thread_name_prefix="scraper")
+        self.slots = threading.BoundedSemaphore(config["workers"] + config["max_pending"])
+        self.stop_event = threading.Event()
+        self._local = threading.local()
+        self._running = set()
+        self._running_lock = threading.Lock()
+
+    @property
+    def session(self):
+        if not hasattr(self._local, "session"):
+            self._local.session = RateLimitedSession(self.bucket)
+        return self._local.session
+
+    def _jitter(self):
+        return random.uniform(0, self.config["jitter_seconds"])
+
+    def _run_job(self, job):
+        slug = _slug(f"{job['query']} {job['location']}")
+        report_path = REPORT_PATH and f"{os.path.splitext(REPORT_PATH)[0]}.{slug}.json"
+        prometheus_path = PROMETHEUS_PATH and f"{os.path.splitext(PROMETHEUS_PATH)[0]}.{slug}.prom"
+        try:
+            if self.stop_event.is_set():
+                return  # queued before shutdown; only runs already in progress are finished
+            run_job_checker(
+                [job["query"]],
+                num_pages=job["num_pages"],
+                location=job["location"],
+                report=RunReport(labels={"job": slug}),
+                session=self.session,
+                report_path=report_path,
+                prometheus_path=prometheus_path,
+            )
+        except Exception as e:
+            print(f"❌ Scraper job '{job['query']}' failed: {e}")
+        finally:
+            with self._running_lock:
+                self._running.discard(slug)
+            self.slots.release()
+
+    def _dispatch(self, job):
+        """Submit a job unless it is already running or the pool is saturated. Returns False to postpone."""
+        slug = _slug(f"{job['query']} {job['location']}")
+        with self._running_lock:
+            if slug in self._running:
+                return False
+            if not self.slots.acquire(blocking=False):
+                return False
+            self._running.add(slug)
+        self.pool.submit(self._run_job, job)
+        return True
+
+    def run(self):
+        now = time.monotonic()
+        schedule = [(now + self._jitter(), i) for i in range(len(self.config["jobs"]))]
+        heapq.heapify(schedule)
+        print(f"🕒 Scraper daemon started with {len(schedule)} jobs and {self.config['workers']} workers")
+
+        while not self.stop_event.is_set():
+            due_at, index = schedule[0]
+            wait = due_at - time.monotonic()
+            if wait > 0:
+                self.stop_event.wait(wait)
+                continue
+
+            job = self.config["jobs"][index]
+            if self._dispatch(job):
+                next_run = time.monotonic() + job["interval_minutes"] * 60 + self._jitter()
+            else:
+                print(f"⏳ '{job['query']}' is still running or workers are busy; postponing")
+                next_run = time.monotonic() + self.config["retry_busy_seconds"]
+            heapq.heapreplace(schedule, (next_run, index))
+
+        print("🛑 Stopping scraper daemon; waiting for in-flight runs to finish...")
+        self.pool.shutdown(wait=True, cancel_futures=True)
+        print("✅ Scraper daemon stopped")
+
+    def stop(self, *_):
+        self.stop_event.set()
+
+
+if __name__ == "__main__":
+    # usage: python scheduler.py [scraper_config.json]
+    daemon = ScraperDaemon(load_config(sys.argv[1] if len(sys.argv) > 1 else CONFIG_PATH))
+    signal.signal(signal.SIGTERM, daemon.stop)
+    signal.signal(signal.SIGINT, daemon.stop)
+    daemon.run()
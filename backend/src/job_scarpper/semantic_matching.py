@@ -0,0 +1,119 @@
+import os
+import sys
+
+import faiss
+import numpy as np
+
+from job_matching import calculate_ats_score, extract_text_from_pdf
+from opportunity_store import OpportunityStore
+
+
+MODEL_NAME = "sentence-transformers/paraphrase-MiniLM-L3-v2"  # same model as the chatbot
+INDEX_PATH = os.path.join(os.path.dirname(__file__), "jobs.faiss")
+HNSW_M = 32
+HNSW_EF_SEARCH = 128
+MAX_TEXT_CHARS = 2000    # the model truncates long inputs anyway
+CANDIDATES_PER_RESULT = 5  # semantic candidates fetched per requested result when re-ranking
+
+
+def job_to_text(job):
+    return f"{job['title'] or ''}\n{(job['description'] or '')[:MAX_TEXT_CHARS]}"
+
+
+class SemanticJobIndex:
+    """Persistent FAISS index of job description embeddings, keyed by opportunity row id.
+
+    Postings are embedded once; sync() only embeds rows added to the store since
+    the last sync. Search goes through an HNSW graph, so retrieval is sub-linear
+    in the number of jobs. Edited postings keep their original embedding until the
+    index file is deleted and rebuilt.
+    """
+
+    def __init__(self, store=None, index_path=INDEX_PATH, model=None):
+        self.store = store or OpportunityStore()
+        self.index_path = index_path
+        self._model = model
+        self.index = faiss.read_index(index_path) if os.path.exists(index_path) else None
+
+    @property
+    def model(self):
+        if self._model is None:
+            from sentence_transformers import SentenceTransformer
+
+            self._model = SentenceTransformer(MODEL_NAME)
+        return self._model
+
+    def _embed(self, texts):
+        vectors = self.model.encode(list(texts), normalize_embeddings=True)
+        return np.ascontiguousarray(vectors, dtype=np.float32)
+
+    def _new_index(self, dim):
+        hnsw = faiss.IndexHNSWFlat(dim, HNSW_M, faiss.METRIC_INNER_PRODUCT)
+        return faiss.IndexIDMap2(hnsw)
+
+    def last_indexed_id(self):
+        if self.index is None or self.index.ntotal == 0:
+            return 0
+        return int(faiss.vector_to_array(self.index.id_map).max())
+
+    def sync(self, batch_size=256):
+        """Embed and add postings that are in the store but not in the index yet."""
+        added = 0
+        last_id = self.last_indexed_id()
+        while True:
+            rows = self.store.ids_after(last_id, batch_size)
+            if not rows:
+                break
+            vectors = self._embed(job_to_text(r) for r in rows)
+            if self.index is None:
+                self.index = self._new_index(vectors.shape[1])
+            ids = np.array([r["id"] for r in rows], dtype=np.int64)
+            self.index.add_with_ids(vectors, ids)
+            last_id = int(ids[-1])
+            added += len(rows)
+        if added:
+            faiss.write_index(self.index, self.index_path)
+        return added
+
+    def search(self, text, k=10):
+        """Top-k (opportunity id, cosine similarity) pairs for a piece of text."""
+        if self.index is None or self.index.ntotal == 0:
+            return []
+        faiss.downcast_index(self.index.index).hnsw.efSearch = max(HNSW_EF_SEARCH, k)
+        scores, ids = self.index.search(self._embed([text]), k)
+        return [(int(i), float(s)) for i, s in zip(ids[0], scores[0]) if i >= 0]
+
+    def match_resume(self, resume_text, k=10, rerank=False):
+        """Top-k jobs for a resume by embedding similarity.
+
+        With rerank=True, k * CANDIDATES_PER_RESULT semantic candidates are
+        re-scored with calculate_ats_score and ordered by that score first.
+        """
+        hits = self.search(resume_text, k * CANDIDATES_PER_RESULT if rerank else k)
+        jobs = self.store.get_many(i for i, _ in hits)
+
+        results = []
+        for job_id, similarity in hits:
+            job = jobs.get(job_id)
+            if job is None:
+                continue
+            results.append({
+                "title": job["title"],
+                "company": job["company"],
+                "similarity": round(similarity, 4),
+                "score": calculate_ats_score(resume_text, job) if rerank else None,
+                "apply_link": job["apply_link"],
+            })
+        if rerank:
+            results.sort(key=lambda r: (r["score"], r["similarity"]), reverse=True)
+        return results[:k]
+
+
+if __name__ == "__main__":
+    # usage: python semantic_matching.py [resume.pdf]
+    semantic_index = SemanticJobIndex()
+    print(f"🧠 Indexed {semantic_index.sync()} new postings")
+    resume_text = extract_text_from_pdf(sys.argv[1] if len(sys.argv) > 1 else "resume.pdf")
+    if resume_text:
+        for r in semantic_index.match_resume(resume_text, rerank=True):
+            print(f"{r['title']} @ {r['company']} -> {r['score']}% match (similarity {r['similarity']})")
@@ -0,0 +1,133 @@
+import sys
+import time
+
+import faiss
+import numpy as np
+from sklearn.decomposition import TruncatedSVD
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.preprocessing import normalize
+
+from reccomondatio import profile_to_text, top_k_neighbours, users
+
+
+SVD_DIM = 128
+HNSW_M = 32               # graph degree; higher = better recall, more memory
+HNSW_EF_SEARCH = 64       # candidates explored per query
+SENTENCE_MODEL = "sentence-transformers/paraphrase-MiniLM-L3-v2"  # same model as the chatbot
+
+
+# ---------------- Embeddings ----------------
+def embed_tfidf_svd(user_list, dim=SVD_DIM):
+    """TF-IDF profiles reduced with truncated SVD, L2-normalised so inner product = cosine."""
+    matrix = TfidfVectorizer().fit_transform([profile_to_text(u) for u in user_list])
+    dim = min(dim, matrix.shape[1] - 1, matrix.shape[0] - 1)
+    if dim < 1:
+        return np.ascontiguousarray(matrix.toarray(), dtype=np.float32)
+    reduced = TruncatedSVD(n_components=dim, random_state=0).fit_transform(matrix)
+    return np.ascontiguousarray(normalize(reduced), dtype=np.float32)
+
+
+def embed_sentences(user_list, model_name=SENTENCE_MODEL):
+    from sentence_transformers import SentenceTransformer
+
+    model = SentenceTransformer(model_name)
+    vectors = model.encode([profile_to_text(u) for u in user_list], normalize_embeddings=True)
+    return np.ascontiguousarray(vectors, dtype=np.float32)
+
+
+EMBEDDERS = {
+    "svd": embed_tfidf_svd,
+    "sentence": embed_sentences,
+}
+
+
+# ---------------- Index ----------------
+class AnnRecommender:
+    """Student-to-student recommendations served from a FAISS inner-product index.
+
+    kind="hnsw" builds an approximate HNSW graph; kind="flat" does exact search
+    over the same embeddings, which is useful as a baseline.
+    """
+
+    def __init__(self, user_list, embedding="svd", kind="hnsw", m=HNSW_M, ef_search=HNSW_EF_SEARCH):
+        self.users = list(user_list)
+        self.row_of = {u["id"]: i for i, u in enumerate(self.users)}
+        self.vectors = EMBEDDERS[embedding](self.users)
+
+        dim = self.vectors.shape[1]
+        if kind == "hnsw":
+            self.index = faiss.IndexHNSWFlat(dim, m, faiss.METRIC_INNER_PRODUCT)
+            self.index.hnsw.efSearch = ef_search
+        elif kind == "flat":
+            self.index = faiss.IndexFlatIP(dim)
+        else:
+            raise ValueError(f"Unknown index kind: {kind}")
+        self.index.add(self.vectors)
+
+    def search(self, rows, k):
+        """Top-k neighbours (self excluded) for the given rows, shaped like top_k_neighbours."""
+        rows = np.asarray(rows)
+        scores, indices = self.index.search(self.vectors[rows], k + 1)
+        out_indices = np.full((len(rows), k), -1, dtype=np.int32)
+        out_scores = np.zeros((len(rows), k), dtype=np.float32)
+        for r, row in enumerate(rows):
+            keep = (indices[r] >= 0) & (indices[r] != row)
+            found = indices[r][keep][:k]
+            out_indices[r, :len(found)] = found
+            out_scores[r, :len(found)] = scores[r][keep][:k]
+        return out_indices, out_scores
+
+    def recommend(self, user_id, top_n=3):
+        row = self.row_of.get(user_id)
+        if row is None:
+            return "User not found"
+        indices, scores = self.search([row], top_n)
+        return [(self.users[i]["name"], round(float(s), 2)) for i, s in zip(indices[0], scores[0]) if i >= 0]
+
+
+# ---------------- Recall comparison ----------------
+def recall_at_k(approx_indices, exact_indices):
+    """Fraction of the exact top-k neighbours that the approximate search also returned."""
+    hits = 0
+    total = 0
+    for approx, exact in zip(approx_indices, exact_indices):
+        exact = set(exact[exact >= 0].tolist())
+        if not exact:
+            continue
+        hits += len(exact & set(approx[approx >= 0].tolist()))
+        total += len(exact)
+    return hits / total if total else 1.0
+
+
+def compare(user_list, k=10, embedding="svd", **index_kwargs):
+    """Recall@k and timings of the FAISS recommender against exact TF-IDF cosine."""
+    start = time.perf_counter()
+    matrix = TfidfVectorizer().fit_transform([profile_to_text(u) for u in user_list])
+    exact_indices, _ = top_k_neighbours(matrix, k)
+    exact_seconds = time.perf_counter() - start
+    k = exact_indices.shape[1]
+
+    start = time.perf_counter()
+    recommender = AnnRecommender(user_list, embedding=embedding, **index_kwargs)
+    build_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    approx_indices, _ = recommender.search(np.arange(len(user_list)), k)
+    search_seconds = time.perf_counter() - start
+
+    return {
+        "users": len(user_list),
+        "k": k,
+        "embedding": embedding,
+        "recall_at_k": round(recall_at_k(approx_indices, exact_indices), 4),
+        "exact_seconds": round(exact_seconds, 3),
+        "ann_build_seconds": round(build_seconds, 3),
+        "ann_search_seconds": round(search_seconds, 3),
+    }
+
+
+if __name__ == "__main__":
+    recommender = AnnRecommender(users, kind=sys.argv[1] if len(sys.argv) > 1 else "hnsw")
+    print("Recommendations for Mohith:")
+    print(recommender.recommend("u123"))
+    print(compare(users, k=3))
@@ -0,0 +1,80 @@
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import numpy as np
+
+from build_artifacts import build
+from reccomondatio import COL_CHUNK_SIZE, TOP_K, column_blocks, top_k_rows, users
+from serve import ARTIFACTS_DIR, RecommenderStore
+
+
+ROW_BLOCK = 2048   # users handled per task
+
+_matrix = None
+_col_blocks = None
+
+
+def _init_worker(matrix, col_block):
+    global _matrix, _col_blocks
+    _matrix = matrix
+    _col_blocks = column_blocks(matrix, col_block)
+
+
+def _top_k_block(bounds, k):
+    """Top-k neighbours for rows [start, stop), scanning candidates one column block at a time.
+
+    Each row keeps a bounded top-k buffer, so memory per task is
+    O(ROW_BLOCK * (COL_CHUNK_SIZE + k)) no matter how many users there are.
+    """
+    start, stop = bounds
+    indices, scores = top_k_rows(_matrix[start:stop], _col_blocks, start, k)
+    return start, indices, scores
+
+
+def parallel_top_k(matrix, k=TOP_K, workers=None, row_block=ROW_BLOCK, col_block=COL_CHUNK_SIZE):
+    """Same result as top_k_neighbours, computed in row blocks across a process pool."""
+    n = matrix.shape[0]
+    k = max(0, min(k, n - 1))
+    indices = np.full((n, k), -1, dtype=np.int32)
+    scores = np.zeros((n, k), dtype=np.float32)
+    if k == 0:
+        return indices, scores
+
+    blocks = [(start, min(start + row_block, n)) for start in range(0, n, row_block)]
+    task = partial(_top_k_block, k=k)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(matrix, col_block)) as pool:
+        for start, block_indices, block_scores in pool.map(task, blocks):
+            indices[start:start + len(block_indices)] = block_indices
+            scores[start:start + len(block_indices)] = block_scores
+    return indices, scores
+
+
+def run(user_list, out_dir=ARTIFACTS_DIR, k=TOP_K, workers=None):
+    """Precompute top-k recommendations for every user and return a store to look them up."""
+    start = time.perf_counter()
+    build(user_list, out_dir, k, neighbours_fn=partial(parallel_top_k, workers=workers))
+    print(f"✅ Precomputed recommendations for {len(user_list)} users in {time.perf_counter() - start:.2f}s")
+    return RecommenderStore(out_dir)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Nightly top-N recommendations for every student")
+    parser.add_argument("users_file", nargs="?", help="JSON list of user profiles (defaults to the sample users)")
+    parser.add_argument("--out", default=ARTIFACTS_DIR)
+    parser.add_argument("-k", type=int, default=TOP_K)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    if args.users_file:
+        with open(args.users_file, "r", encoding="utf-8") as f:
+            user_list = json.load(f)
+    else:
+        user_list = users
+
+    store = run(user_list, args.out, args.k, args.workers)
+    print("Recommendations for", store.users[0]["name"] + ":")
+    print(store.recommend(store.users[0]["id"]))
@@ -0,0 +1,93 @@
+import json
+import os
+import sys
+import time
+
+import joblib
+import numpy as np
+import scipy.sparse as sp
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from profiles import profile_to_text
+from reccomondatio import TOP_K, top_k_neighbours, users
+from serve import (
+    ARTIFACTS_DIR,
+    INDICES_FILE,
+    MANIFEST_FILE,
+    PROFILES_FILE,
+    SCORES_FILE,
+    USERS_FILE,
+    VECTORIZER_FILE,
+)
+
+
+def _replace(path, write):
+    """Write to a temp file next to path and swap it in, so readers never see a partial file."""
+    tmp = path + ".tmp"
+    write(tmp)
+    os.replace(tmp, path)
+
+
+def save_neighbours(indices, scores, out_dir=ARTIFACTS_DIR):
+    """Store neighbour lists as plain .npy arrays so the server can np.load(..., mmap_mode='r') them."""
+    os.makedirs(out_dir, exist_ok=True)
+
+    def write_array(array):
+        def write(tmp):
+            with open(tmp, "wb") as f:
+                np.save(f, array)
+        return write
+
+    _replace(os.path.join(out_dir, INDICES_FILE), write_array(np.ascontiguousarray(indices, dtype=np.int32)))
+    _replace(os.path.join(out_dir, SCORES_FILE), write_array(np.ascontiguousarray(scores, dtype=np.float32)))
+
+
+def build(user_list, out_dir=ARTIFACTS_DIR, k=TOP_K, neighbours_fn=top_k_neighbours):
+    """Fit the vectorizer, compute top-k neighbours and save everything the server needs.
+
+    neighbours_fn(matrix, k) -> (indices, scores) lets batch_recommend.py swap in
+    its parallel implementation.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    start = time.perf_counter()
+
+    vectorizer = TfidfVectorizer(dtype=np.float32)
+    matrix = vectorizer.fit_transform([profile_to_text(u) for u in user_list]).tocsr()
+    indices, scores = neighbours_fn(matrix, k)
+
+    _replace(os.path.join(out_dir, VECTORIZER_FILE), lambda tmp: joblib.dump(vectorizer, tmp))
+
+    def write_profiles(tmp):
+        with open(tmp, "wb") as f:
+            sp.save_npz(f, matrix, compressed=False)
+
+    _replace(os.path.join(out_dir, PROFILES_FILE), write_profiles)
+    save_neighbours(indices, scores, out_dir)
+
+    def write_json(data):
+        def write(tmp):
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+        return write
+
+    _replace(
+        os.path.join(out_dir, USERS_FILE),
+        write_json([{"id": u["id"], "name": u["name"]} for u in user_list]),
+    )
+    # manifest goes last: its presence marks a complete build
+    _replace(
+        os.path.join(out_dir, MANIFEST_FILE),
+        write_json({"n_users": len(user_list), "k": int(indices.shape[1]), "built_at": time.time()}),
+    )
+
+    print(f"✅ Built recommender artifacts for {len(user_list)} users in {time.perf_counter() - start:.2f}s -> {out_dir}")
+
+
+if __name__ == "__main__":
+    # usage: python build_artifacts.py [users.json] [out_dir]
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], "r", encoding="utf-8") as f:
+            user_list = json.load(f)
+    else:
+        user_list = users
+    build(user_list, sys.argv[2] if len(sys.argv) > 2 else ARTIFACTS_DIR)
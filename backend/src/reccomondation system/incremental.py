@@ -0,0 +1,213 @@
+import time
+
+import numpy as np
+import scipy.sparse as sp
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.preprocessing import normalize
+
+from reccomondatio import CHUNK_SIZE, TOP_K, profile_to_text, top_k_neighbours, users
+
+
+N_FEATURES = 2 ** 18     # hashed vocabulary size, no fitting needed
+COMPACT_AFTER = 256      # pending row edits before they are merged into the base matrix
+
+
+class IncrementalRecommender:
+    """Student-to-student recommender that updates one profile without a full refit.
+
+    Profiles are vectorised with a HashingVectorizer, so there is no vocabulary to
+    fit. IDF weights are frozen between refreshes: document frequencies are kept up
+    to date on every change, but rows are only re-weighted by refresh_idf(), which
+    can run periodically (refresh_every updates) or on demand.
+
+    Edited and new rows live in a small delta on top of the base CSR matrix and are
+    compacted into it once there are more than COMPACT_AFTER of them.
+    """
+
+    def __init__(self, initial_users=(), k=TOP_K, refresh_every=None, chunk_size=CHUNK_SIZE):
+        self.k = k
+        self.refresh_every = refresh_every
+        self.chunk_size = chunk_size
+        self.hasher = HashingVectorizer(
+            n_features=N_FEATURES, alternate_sign=False, norm=None, dtype=np.float32
+        )
+
+        self.users = []
+        self.user_ids = []
+        self.row_of = {}
+        self.df = np.zeros(N_FEATURES, dtype=np.int64)
+        self.idf = np.ones(N_FEATURES, dtype=np.float32)
+        self.updates_since_refresh = 0
+
+        self._base_counts = sp.csr_matrix((0, N_FEATURES), dtype=np.float32)
+        self._base = sp.csr_matrix((0, N_FEATURES), dtype=np.float32)
+        self._delta_counts = {}
+        self._delta = {}
+
+        initial_users = list(initial_users)
+        if initial_users:
+            counts = self.hasher.transform([profile_to_text(u) for u in initial_users]).tocsr()
+            for user in initial_users:
+                self.row_of[user["id"]] = len(self.users)
+                self.users.append(user)
+                self.user_ids.append(user["id"])
+            self.df += np.bincount(counts.indices, minlength=N_FEATURES)
+            self._base_counts = counts
+        self.refresh_idf()
+
+    # ---------------- Vectors ----------------
+    def _weight(self, counts):
+        return normalize(counts.multiply(self.idf).tocsr())
+
+    def _similarities(self, vector):
+        """Cosine similarity of one weighted row against every stored row."""
+        n = len(self.users)
+        sims = np.full(n, -np.inf, dtype=np.float32)
+        base_rows = self._base.shape[0]
+        if base_rows:
+            sims[:base_rows] = (self._base @ vector.T).toarray().ravel()
+        if self._delta:
+            rows = np.fromiter(self._delta.keys(), dtype=np.int64, count=len(self._delta))
+            pending = sp.vstack(list(self._delta.values()), format="csr")
+            sims[rows] = (pending @ vector.T).toarray().ravel()
+        return sims
+
+    def _row_vector(self, row):
+        if row in self._delta:
+            return self._delta[row]
+        return self._base[row]
+
+    def _best(self, sims, row):
+        """Top-k (indices, scores) for one row, padded with -1 like top_k_neighbours."""
+        sims = sims.copy()
+        sims[row] = -np.inf
+        indices = np.full(self.k, -1, dtype=np.int32)
+        scores = np.zeros(self.k, dtype=np.float32)
+        k = min(self.k, len(sims) - 1)
+        if k <= 0:
+            return indices, scores
+        best = np.argpartition(-sims, k - 1)[:k]
+        best = best[np.argsort(-sims[best], kind="stable")]
+        indices[:k] = best
+        scores[:k] = sims[best]
+        return indices, scores
+
+    def _compact(self):
+        """Merge pending rows into the base matrices."""
+        if not self._delta:
+            return
+        n = len(self.users)
+        base_rows = self._base.shape[0]
+        rows = list(self._delta.keys())
+        order = np.arange(n)
+        order[rows] = base_rows + np.arange(len(rows))
+        delta_counts = sp.vstack([self._delta_counts[r] for r in rows], format="csr")
+        delta = sp.vstack([self._delta[r] for r in rows], format="csr")
+        self._base_counts = sp.vstack([self._base_counts, delta_counts], format="csr")[order]
+        self._base = sp.vstack([self._base, delta], format="csr")[order]
+        self._delta_counts = {}
+        self._delta = {}
+
+    # ---------------- Updates ----------------
+    def refresh_idf(self):
+        """Recompute IDF from the current document frequencies and rebuild all neighbours."""
+        self._compact()
+        n_docs = len(self.users)
+        # same smoothing as TfidfVectorizer(smooth_idf=True)
+        self.idf = (np.log((1 + n_docs) / (1 + self.df)) + 1).astype(np.float32)
+        self._base = self._weight(self._base_counts)
+
+        indices, scores = top_k_neighbours(self._base, self.k, self.chunk_size)
+        width = indices.shape[1]
+        self.neighbour_indices = np.full((n_docs, self.k), -1, dtype=np.int32)
+        self.neighbour_scores = np.zeros((n_docs, self.k), dtype=np.float32)
+        self.neighbour_indices[:, :width] = indices
+        self.neighbour_scores[:, :width] = scores
+        self.updates_since_refresh = 0
+
+    def upsert_user(self, user):
+        """Add a new user or replace an existing user's profile, updating only affected neighbour lists."""
+        counts = self.hasher.transform([profile_to_text(user)]).tocsr()
+        row = self.row_of.get(user["id"])
+        if row is None:
+            row = len(self.users)
+            self.row_of[user["id"]] = row
+            self.users.append(user)
+            self.user_ids.append(user["id"])
+            self.neighbour_indices = np.vstack(
+                [self.neighbour_indices, np.full((1, self.k), -1, dtype=np.int32)]
+            )
+            self.neighbour_scores = np.vstack(
+                [self.neighbour_scores, np.zeros((1, self.k), dtype=np.float32)]
+            )
+        else:
+            self.users[row] = user
+            old_counts = self._delta_counts.get(row)
+            if old_counts is None:
+                old_counts = self._base_counts[row]
+            self.df[old_counts.indices] -= 1
+        self.df[counts.indices] += 1
+
+        vector = self._weight(counts)
+        self._delta_counts[row] = counts
+        self._delta[row] = vector
+        self._update_neighbours(row, vector)
+
+        self.updates_since_refresh += 1
+        if self.refresh_every and self.updates_since_refresh >= self.refresh_every:
+            self.refresh_idf()
+        elif len(self._delta) > COMPACT_AFTER:
+            self._compact()
+
+    def _update_neighbours(self, row, vector):
+        sims = self._similarities(vector)
+        self.neighbour_indices[row], self.neighbour_scores[row] = self._best(sims, row)
+
+        # Users that listed this row before the edit may now have a better candidate elsewhere
+        stale = np.nonzero((self.neighbour_indices == row).any(axis=1))[0]
+        stale = stale[stale != row]
+        for other in stale:
+            other_sims = self._similarities(self._row_vector(other))
+            self.neighbour_indices[other], self.neighbour_scores[other] = self._best(other_sims, other)
+
+        # Everyone else only needs to check whether this row now enters their list
+        sims[row] = -np.inf
+        sims[stale] = -np.inf
+        worst = np.where(self.neighbour_indices[:, -1] < 0, -np.inf, self.neighbour_scores[:, -1])
+        for other in np.nonzero(sims > worst)[0]:
+            self._insert_neighbour(other, row, sims[other])
+
+    def _insert_neighbour(self, row, neighbour, score):
+        indices = self.neighbour_indices[row]
+        scores = self.neighbour_scores[row]
+        filled = indices >= 0
+        pos = int(np.count_nonzero(filled & (scores >= score)))
+        indices[pos + 1:] = indices[pos:-1].copy()
+        scores[pos + 1:] = scores[pos:-1].copy()
+        indices[pos] = neighbour
+        scores[pos] = score
+
+    # ---------------- Lookup ----------------
+    def recommend(self, user_id, top_n=3):
+        row = self.row_of.get(user_id)
+        if row is None:
+            return "User not found"
+        neighbours = zip(self.neighbour_indices[row][:top_n], self.neighbour_scores[row][:top_n])
+        return [(self.users[i]["name"], round(float(score), 2)) for i, score in neighbours if i >= 0]
+
+
+if __name__ == "__main__":
+    recommender = IncrementalRecommender(users)
+    print("Recommendations for Mohith:")
+    print(recommender.recommend("u123"))
+
+    start = time.perf_counter()
+    recommender.upsert_user({
+        "id": "u127",
+        "name": "Dana",
+        "skills": ["python", "machine learning"],
+        "projects": ["recommendation system"],
+        "certifications": ["TensorFlow"]
+    })
+    print(f"Added Dana in {(time.perf_counter() - start) * 1000:.2f} ms")
+    print(recommender.recommend("u123"))
@@ -0,0 +1,142 @@
+import hashlib
+import json
+import os
+import sys
+
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from reccomondatio import CHUNK_SIZE, profile_to_text, users
+
+
+SCRAPER_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "job_scarpper")
+
+
+def open_store():
+    """The scraper's OpportunityStore, which lives next to job_scarpper.py."""
+    if SCRAPER_DIR not in sys.path:
+        sys.path.insert(0, SCRAPER_DIR)
+    from opportunity_store import OpportunityStore
+
+    return OpportunityStore()
+
+
+def load_jobs(jobs_file=None, store=None):
+    """Scraped job postings from the opportunity store, or from a legacy JSON export when jobs_file is given."""
+    if jobs_file is not None:
+        with open(jobs_file, "r", encoding="utf-8") as f:
+            return json.load(f)
+    return list((store or open_store()).iter_all(category="job"))
+
+
+def job_to_text(job):
+    """Text used to match a scraped job record (see build_opportunity) against profiles."""
+    parts = [job.get("title") or ""]
+    parts += job.get("skills", []) + job.get("good_to_have", []) + job.get("topics", [])
+    return " ".join(p for p in parts if p)
+
+
+def _profile_hash(user):
+    return hashlib.sha1(profile_to_text(user).encode("utf-8")).hexdigest()
+
+
+def _top_n(scores, top_n):
+    """Indices of the top_n columns per row of a dense score block, best first."""
+    n = min(top_n, scores.shape[1])
+    if n == 0:
+        return np.zeros((scores.shape[0], 0), dtype=np.int64)
+    best = np.argpartition(-scores, n - 1, axis=1)[:, :n]
+    order = np.argsort(-np.take_along_axis(scores, best, axis=1), axis=1, kind="stable")
+    return np.take_along_axis(best, order, axis=1)
+
+
+class JobRecommender:
+    """User -> job recommendations over a resident job TF-IDF matrix.
+
+    The job vocabulary is fitted once per job set. Users are projected into it with
+    transform() and scored against every job with one sparse product. Results are
+    cached per user and dropped when the job set changes or the user's profile text
+    differs from the one the cached entry was computed for. Without an explicit job
+    list, jobs come from the opportunity store and are reloaded whenever its
+    version() changes.
+    """
+
+    def __init__(self, jobs=None, top_n=10, store=None):
+        self.top_n = top_n
+        self.jobs_version = 0
+        self._cache = {}
+        self.store = None
+        self._store_version = None
+        if jobs is None:
+            self.store = store or open_store()
+            self._refresh()
+        else:
+            self.set_jobs(jobs)
+
+    def _refresh(self):
+        """Reload jobs from the store if it changed since they were loaded."""
+        if self.store is None:
+            return
+        version = self.store.version()
+        if version != self._store_version:
+            self.set_jobs(load_jobs(store=self.store))
+            self._store_version = version
+
+    def set_jobs(self, jobs):
+        """Refit the job vocabulary and invalidate every cached recommendation."""
+        self.jobs = list(jobs)
+        texts = [job_to_text(j) for j in self.jobs]
+        self.vectorizer = TfidfVectorizer()
+        if any(t.strip() for t in texts):
+            self.job_matrix = self.vectorizer.fit_transform(texts)
+            self.job_matrix_t = self.job_matrix.T.tocsc()
+        else:
+            # nothing scraped yet; every user gets an empty list until jobs arrive
+            self.job_matrix = self.job_matrix_t = None
+        self.jobs_version += 1
+        self._cache.clear()
+
+    def invalidate(self, user_id=None):
+        if user_id is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(user_id, None)
+
+    def _score(self, user_list, top_n):
+        """Top-n (job index, score) lists for a batch of users."""
+        if self.job_matrix is None:
+            return [[] for _ in user_list]
+        results = []
+        for start in range(0, len(user_list), CHUNK_SIZE):
+            chunk = user_list[start:start + CHUNK_SIZE]
+            profiles = self.vectorizer.transform([profile_to_text(u) for u in chunk])
+            # both sides are L2-normalised, so the dot product is the cosine similarity
+            scores = (profiles @ self.job_matrix_t).toarray()
+            best = _top_n(scores, top_n)
+            for row, cols in enumerate(best):
+                results.append([(int(c), float(scores[row, c])) for c in cols])
+        return results
+
+    def precompute(self, user_list):
+        """Fill the cache for many users at once."""
+        self._refresh()
+        user_list = list(user_list)
+        for user, ranked in zip(user_list, self._score(user_list, self.top_n)):
+            self._cache[user["id"]] = (_profile_hash(user), self.jobs_version, ranked)
+
+    def recommend_jobs(self, user, top_n=3):
+        self._refresh()
+        key = (_profile_hash(user), self.jobs_version)
+        cached = self._cache.get(user["id"])
+        if cached is None or cached[:2] != key or len(cached[2]) < min(top_n, len(self.jobs)):
+            ranked = self._score([user], max(top_n, self.top_n))[0]
+            cached = key + (ranked,)
+            self._cache[user["id"]] = cached
+        return [(self.jobs[i]["title"], round(score, 2)) for i, score in cached[2][:top_n]]
+
+
+if __name__ == "__main__":
+    recommender = JobRecommender()
+    recommender.precompute(users)
+    print("Job Recommendations for Mohith:")
+    print(recommender.recommend_jobs(users[0]))
@@ -0,0 +1,3 @@
+def profile_to_text(user):
+    """Text a student profile is vectorised from; shared by the build and serve sides."""
+    return " ".join(user["skills"] + user["projects"] + user["certifications"])
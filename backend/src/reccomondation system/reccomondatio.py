@@ -1,7 +1,9 @@
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+import numpy as np
 import pandas as pd
 
+from profiles import profile_to_text
+
 
 users = [
     {
@@ -34,32 +36,103 @@ users = [
     }
 ]
 
+TOP_K = 10              # neighbours kept per user (upper bound for top_n)
+CHUNK_SIZE = 1024       # rows multiplied per sparse product
+COL_CHUNK_SIZE = 4096   # candidate users scored per sparse product
+
+
+def column_blocks(matrix, col_chunk_size=COL_CHUNK_SIZE):
+    """Candidate columns of matrix.T as (first column, CSC slice) pairs, sliced once per matrix."""
+    n = matrix.shape[0]
+    matrix_t = matrix.T.tocsc()
+    return [(start, matrix_t[:, start:min(start + col_chunk_size, n)]) for start in range(0, n, col_chunk_size)]
+
+
+def top_k_rows(rows, col_blocks, start, k):
+    """Top-k neighbours for the rows of the matrix beginning at row `start`.
+
+    Candidates are scored one column block at a time into a float32 buffer and
+    only each block's own top-k is merged into a running top-k per row, so
+    memory is O(len(rows) * (col block + k)) however many users there are.
+    Returns (indices int32, scores float32) shaped like top_k_neighbours.
+    """
+    m = rows.shape[0]
+    row_ids = np.arange(start, start + m)
+    best_indices = np.full((m, k), -1, dtype=np.int64)
+    best_scores = np.full((m, k), -np.inf, dtype=np.float32)
+    for col_start, cols in col_blocks:
+        width = cols.shape[1]
+        # TF-IDF rows are L2-normalised, so the dot product is the cosine similarity
+        block = (rows @ cols).toarray().astype(np.float32, copy=False)
+        inside = (row_ids >= col_start) & (row_ids < col_start + width)
+        block[inside.nonzero()[0], row_ids[inside] - col_start] = -np.inf  # skip self
+
+        if width > k:
+            cand = np.argpartition(block, width - k, axis=1)[:, width - k:]
+            cand_scores = np.take_along_axis(block, cand, axis=1)
+        else:
+            cand = np.broadcast_to(np.arange(width), block.shape)
+            cand_scores = block
+        indices = np.concatenate([best_indices, cand + col_start], axis=1)
+        scores = np.concatenate([best_scores, cand_scores], axis=1)
+        keep = np.argpartition(scores, scores.shape[1] - k, axis=1)[:, scores.shape[1] - k:]
+        best_indices = np.take_along_axis(indices, keep, axis=1)
+        best_scores = np.take_along_axis(scores, keep, axis=1)
+
+    order = np.argsort(-best_scores, axis=1, kind="stable")
+    best_indices = np.take_along_axis(best_indices, order, axis=1)
+    best_scores = np.take_along_axis(best_scores, order, axis=1)
+    missing = ~np.isfinite(best_scores)
+    best_indices[missing] = -1
+    best_scores[missing] = 0
+    return best_indices.astype(np.int32), best_scores
+
+
+def top_k_neighbours(matrix, k=TOP_K, chunk_size=CHUNK_SIZE, col_chunk_size=COL_CHUNK_SIZE):
+    """Keep only the k most similar rows for every row of an L2-normalised sparse matrix.
+
+    Rows are processed chunk_size at a time against col_chunk_size candidates at a
+    time, so the dense float32 similarity buffer stays at chunk_size * col_chunk_size
+    (16 MB with the defaults) and the result at O(N * k), instead of a dense N x N
+    similarity matrix. Returns (indices, scores), both shaped (N, k), sorted by
+    descending score. Self matches are excluded; slots without a neighbour have index -1.
+    """
+    n = matrix.shape[0]
+    k = max(0, min(k, n - 1))
+    indices = np.full((n, k), -1, dtype=np.int32)
+    scores = np.zeros((n, k), dtype=np.float32)
+    if k == 0:
+        return indices, scores
+
+    blocks = column_blocks(matrix, col_chunk_size)
+    for start in range(0, n, chunk_size):
+        stop = min(start + chunk_size, n)
+        indices[start:stop], scores[start:stop] = top_k_rows(matrix[start:stop], blocks, start, k)
+    return indices, scores
 
-def profile_to_text(user):
-    return " ".join(user["skills"] + user["projects"] + user["certifications"])
 
 user_ids = [u["id"] for u in users]
+user_index = {uid: i for i, uid in enumerate(user_ids)}
 profiles = [profile_to_text(u) for u in users]
 
 
-vectorizer = TfidfVectorizer()
+vectorizer = TfidfVectorizer(dtype=np.float32)
 tfidf_matrix = vectorizer.fit_transform(profiles)
 
 
-similarity_matrix = cosine_similarity(tfidf_matrix)
+neighbour_indices, neighbour_scores = top_k_neighbours(tfidf_matrix)
 
 
 def recommend(user_id, top_n=3):
-    if user_id not in user_ids:
+    idx = user_index.get(user_id)
+    if idx is None:
         return "User not found"
-    idx = user_ids.index(user_id)
-    sim_scores = list(enumerate(similarity_matrix[idx]))
-    sim_scores = sorted(sim_scores, key=lambda x: x[1], reverse=True)
-    sim_scores = sim_scores[1:top_n+1]  # skip self
+    neighbours = zip(neighbour_indices[idx][:top_n], neighbour_scores[idx][:top_n])
 
-    recommendations = [(users[i]["name"], round(score, 2)) for i, score in sim_scores]
+    recommendations = [(users[i]["name"], round(float(score), 2)) for i, score in neighbours if i >= 0]
     return recommendations
 
 
-print("Recommendations for Mohith:")
-print(recommend("u123"))
+if __name__ == "__main__":
+    print("Recommendations for Mohith:")
+    print(recommend("u123"))
@@ -0,0 +1,105 @@
+import json
+import os
+import threading
+
+import joblib
+import numpy as np
+import scipy.sparse as sp
+
+from profiles import profile_to_text
+
+
+ARTIFACTS_DIR = os.path.join(os.path.dirname(__file__), "artifacts")
+
+VECTORIZER_FILE = "vectorizer.joblib"
+PROFILES_FILE = "profiles.npz"
+INDICES_FILE = "neighbour_indices.npy"
+SCORES_FILE = "neighbour_scores.npy"
+USERS_FILE = "users.json"
+MANIFEST_FILE = "manifest.json"
+
+
+class RecommenderStore:
+    """Read-only view over artifacts written by build_artifacts.py.
+
+    Neighbour lists are memory-mapped, so opening the store costs a few file maps
+    rather than a refit. The vectorizer and profile matrix are only loaded when a
+    profile outside the build has to be scored.
+    """
+
+    def __init__(self, artifacts_dir=ARTIFACTS_DIR):
+        self.artifacts_dir = artifacts_dir
+        self._lock = threading.Lock()
+        self._vectorizer = None
+        self._profiles = None
+
+        with open(self._path(MANIFEST_FILE), "r", encoding="utf-8") as f:
+            self.manifest = json.load(f)
+        with open(self._path(USERS_FILE), "r", encoding="utf-8") as f:
+            self.users = json.load(f)
+        self.row_of = {u["id"]: i for i, u in enumerate(self.users)}
+        self.neighbour_indices = np.load(self._path(INDICES_FILE), mmap_mode="r")
+        self.neighbour_scores = np.load(self._path(SCORES_FILE), mmap_mode="r")
+
+    def _path(self, name):
+        return os.path.join(self.artifacts_dir, name)
+
+    @property
+    def vectorizer(self):
+        if self._vectorizer is None:
+            with self._lock:
+                if self._vectorizer is None:
+                    self._vectorizer = joblib.load(self._path(VECTORIZER_FILE))
+        return self._vectorizer
+
+    @property
+    def profiles(self):
+        if self._profiles is None:
+            with self._lock:
+                if self._profiles is None:
+                    self._profiles = sp.load_npz(self._path(PROFILES_FILE)).tocsr()
+        return self._profiles
+
+    def recommend(self, user_id, top_n=3):
+        row = self.row_of.get(user_id)
+        if row is None:
+            return "User not found"
+        neighbours = zip(self.neighbour_indices[row][:top_n], self.neighbour_scores[row][:top_n])
+        return [(self.users[i]["name"], round(float(score), 2)) for i, score in neighbours if i >= 0]
+
+    def recommend_for_profile(self, user, top_n=3):
+        """Score a profile that is not part of the build (e.g. a student who just signed up)."""
+        vector = self.vectorizer.transform([profile_to_text(user)])
+        sims = (self.profiles @ vector.T).toarray().ravel()
+        row = self.row_of.get(user.get("id"))
+        if row is not None:
+            sims[row] = -np.inf
+        n = min(top_n, len(sims) - (row is not None))
+        if n <= 0:
+            return []
+        best = np.argpartition(-sims, n - 1)[:n]
+        best = best[np.argsort(-sims[best], kind="stable")]
+        return [(self.users[i]["name"], round(float(sims[i]), 2)) for i in best]
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store(artifacts_dir=ARTIFACTS_DIR):
+    """Process-wide store, opened on first use."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = RecommenderStore(artifacts_dir)
+    return _store
+
+
+def recommend(user_id, top_n=3):
+    return get_store().recommend(user_id, top_n)
+
+
+if __name__ == "__main__":
+    print("Recommendations for Mohith:")
+    print(recommend("u123"))
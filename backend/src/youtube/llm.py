@@ -0,0 +1,159 @@
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+
+
+CACHE_PATH = os.path.join(os.path.dirname(__file__), ".cache", "llm_cache.sqlite3")
+CACHE_TTL = 30 * 24 * 3600          # seconds a cached response stays valid
+CACHE_MAX_BYTES = 50 * 1024 * 1024  # least recently used responses are evicted past this
+
+
+# ---------------- Response cache ----------------
+class LLMCache:
+    """Content-addressed (model + prompt -> response) cache persisted in SQLite.
+
+    Entries expire after ttl seconds; once the stored responses exceed max_bytes
+    the least recently used ones are evicted.
+    """
+
+    def __init__(self, path=CACHE_PATH, ttl=CACHE_TTL, max_bytes=CACHE_MAX_BYTES):
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            """CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                response TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                last_used REAL NOT NULL
+            )"""
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used)")
+        self._db.commit()
+
+    @staticmethod
+    def key(prompt, model):
+        return hashlib.sha256(f"{model}\0{prompt}".encode("utf-8")).hexdigest()
+
+    def get(self, prompt, model):
+        key = self.key(prompt, model)
+        now = time.time()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT response, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if now - row[1] > self.ttl:
+                self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._db.commit()
+                return None
+            self._db.execute("UPDATE responses SET last_used = ? WHERE key = ?", (now, key))
+            self._db.commit()
+            return row[0]
+
+    def set(self, prompt, model, response):
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (self.key(prompt, model), model, response, len(response.encode("utf-8")), now, now),
+            )
+            self._evict(now)
+            self._db.commit()
+
+    def _evict(self, now):
+        self._db.execute("DELETE FROM responses WHERE created_at < ?", (now - self.ttl,))
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        excess = total - self.max_bytes
+        freed = 0
+        stale = []
+        for key, size in self._db.execute("SELECT key, size FROM responses ORDER BY last_used"):
+            stale.append((key,))
+            freed += size
+            if freed >= excess:
+                break
+        self._db.executemany("DELETE FROM responses WHERE key = ?", stale)
+
+    def delete(self, prompt, model):
+        with self._lock:
+            self._db.execute("DELETE FROM responses WHERE key = ?", (self.key(prompt, model),))
+            self._db.commit()
+
+    def clear(self):
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+            self._db.commit()
+
+
+# ---------------- Backends ----------------
+class DeepSeekBackend:
+    """Calls the DeepSeek chat completions API through an OpenAI client."""
+
+    def __init__(self, client):
+        self.client = client
+
+    def __call__(self, prompt, model):
+        response = self.client.chat.completions.create(
+            model=model,
+            messages=[{"role": "user", "content": prompt}],
+            stream=False
+        )
+        return response.choices[0].message.content
+
+
+class StubBackend:
+    """Offline backend with deterministic canned responses, for tests and benchmarks.
+
+    Set LLM_BACKEND=stub to run the whole level flow without network access.
+    """
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.calls = 0
+
+    def __call__(self, prompt, model):
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        videos = re.search(r"^VIDEOS: (.*)$", prompt, re.MULTILINE)
+        if videos:
+            return self._question_batch(json.loads(videos.group(1)))
+        if "QUESTION:" in prompt:
+            return self._question(prompt)
+        return "Good attempt! The solution is correct. Consider adding edge case handling."
+
+    @staticmethod
+    def _question(prompt):
+        match = re.search(r"video title '(.*?)'", prompt)
+        title = match.group(1) if match else "the video"
+        digest = hashlib.sha1(prompt.encode("utf-8")).hexdigest()[:8]
+        return (
+            f"QUESTION: Write a Python function related to '{title}' (variant {digest}).\n"
+            f"SOLUTION: def solve():\n    pass\n"
+            f"EXPLANATION: A stub question generated offline for '{title}'."
+        )
+
+    @staticmethod
+    def _question_batch(videos):
+        return json.dumps([
+            {
+                "index": video["index"],
+                "question": f"Write a Python function related to '{video['title']}'.",
+                "solution": "def solve():\n    pass",
+                "explanation": f"A stub question generated offline for '{video['title']}'.",
+            }
+            for video in videos
+        ])
@@ -0,0 +1,143 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+
+
+CACHE_DIR = os.path.join(os.path.dirname(__file__), ".cache")
+VIDEO_TTL = 7 * 24 * 3600   # video titles rarely change; refetch after a week
+MAX_IDS_PER_CALL = 50       # videos.list limit
+
+# Partial responses: only ask for what the level flow uses
+VIDEO_FIELDS = "items(id,snippet/title)"
+PLAYLIST_FIELDS = "etag,nextPageToken,items(snippet(title,resourceId/videoId))"
+
+
+class DiskCache:
+    """One JSON file per key under a directory, written atomically."""
+
+    def __init__(self, directory=CACHE_DIR):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, hashlib.sha1(key.encode("utf-8")).hexdigest() + ".json")
+
+    def get(self, key):
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def set(self, key, value):
+        path = self._path(key)
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(value, f)
+        os.replace(tmp, path)
+
+
+class YouTubeMetadata:
+    """Quota-friendly access to playlist and video titles.
+
+    - videos.list is called with up to 50 IDs at a time
+    - every request uses the fields parameter for a partial response
+    - playlist pages are cached on disk and revalidated with their ETag
+      (a 304 means the cached page is reused)
+    - several playlists can be fetched concurrently
+    """
+
+    def __init__(self, api_key, cache=None, max_workers=4):
+        self.api_key = api_key
+        self.cache = cache or DiskCache()
+        self.max_workers = max_workers
+        self._local = threading.local()
+
+    @property
+    def client(self):
+        # googleapiclient clients share an httplib2.Http, which is not thread-safe
+        if not hasattr(self._local, "client"):
+            self._local.client = build("youtube", "v3", developerKey=self.api_key, cache_discovery=False)
+        return self._local.client
+
+    # ---------------- Videos ----------------
+    def get_videos(self, video_ids):
+        """Return {video_id: title} for the given IDs, fetching only missing or expired ones."""
+        titles = {}
+        missing = []
+        now = time.time()
+        for video_id in dict.fromkeys(video_ids):
+            cached = self.cache.get(f"video:{video_id}")
+            if cached and now - cached["fetched_at"] < VIDEO_TTL:
+                titles[video_id] = cached["title"]
+            else:
+                missing.append(video_id)
+
+        for start in range(0, len(missing), MAX_IDS_PER_CALL):
+            batch = missing[start:start + MAX_IDS_PER_CALL]
+            response = self.client.videos().list(
+                part="snippet", id=",".join(batch), fields=VIDEO_FIELDS
+            ).execute()
+            for item in response.get("items", []):
+                title = item["snippet"]["title"]
+                titles[item["id"]] = title
+                self.cache.set(f"video:{item['id']}", {"title": title, "fetched_at": now})
+        return titles
+
+    def get_video_title(self, video_id):
+        return self.get_videos([video_id]).get(video_id, "Untitled Video")
+
+    # ---------------- Playlists ----------------
+    def _get_playlist_page(self, playlist_id, page_token):
+        key = f"playlist:{playlist_id}:{page_token or ''}"
+        cached = self.cache.get(key)
+
+        request = self.client.playlistItems().list(
+            part="snippet",
+            playlistId=playlist_id,
+            maxResults=50,
+            pageToken=page_token,
+            fields=PLAYLIST_FIELDS,
+        )
+        if cached:
+            request.headers["If-None-Match"] = cached["etag"]
+        try:
+            response = request.execute()
+        except HttpError as e:
+            if cached and e.resp.status == 304:
+                return cached
+            raise
+
+        page = {
+            "etag": response.get("etag"),
+            "next_page_token": response.get("nextPageToken"),
+            "videos": [
+                {"id": item["snippet"]["resourceId"]["videoId"], "title": item["snippet"]["title"]}
+                for item in response.get("items", [])
+            ],
+        }
+        if page["etag"]:
+            self.cache.set(key, page)
+        return page
+
+    def get_playlist_videos(self, playlist_id):
+        videos = []
+        page_token = None
+        while True:
+            page = self._get_playlist_page(playlist_id, page_token)
+            videos.extend(page["videos"])
+            page_token = page["next_page_token"]
+            if not page_token:
+                return videos
+
+    def get_playlists(self, playlist_ids):
+        """Fetch several playlists concurrently; returns {playlist_id: [videos]}."""
+        playlist_ids = list(dict.fromkeys(playlist_ids))
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            return dict(zip(playlist_ids, pool.map(self.get_playlist_videos, playlist_ids)))
@@ -1,8 +1,14 @@
+import json
+import os
 import re
 import random
-from googleapiclient.discovery import build
+import time
+from concurrent.futures import ThreadPoolExecutor
 from openai import OpenAI 
 
+from llm import DeepSeekBackend, LLMCache, StubBackend
+from metadata import YouTubeMetadata
+
 
 YOUTUBE_API_KEY = "YOUR API KEY"  
 DEEPSEEK_API_KEY = "YOUR API KEY"
@@ -13,7 +19,22 @@ deepseek_client = OpenAI(
     base_url="https://api.deepseek.com/v1", 
 )
 
-youtube = build("youtube", "v3", developerKey=YOUTUBE_API_KEY)
+# LLM_BACKEND=stub serves deterministic canned responses without network access,
+# cached in memory so they never end up in the persistent cache
+if os.getenv("LLM_BACKEND") == "stub":
+    llm_backend = StubBackend()
+    llm_cache = LLMCache(":memory:")
+else:
+    llm_backend = DeepSeekBackend(deepseek_client)
+    llm_cache = LLMCache()
+
+youtube_metadata = YouTubeMetadata(YOUTUBE_API_KEY)
+
+PREFETCH_AHEAD = 3     # levels generated ahead of the one being played
+PREFETCH_WORKERS = 2   # concurrent question requests
+QUESTION_RETRIES = 3
+QUESTION_BATCH_SIZE = 10  # video titles per batched (JSON) question request
+QUESTION_FIELDS = ("question", "solution", "explanation")
 
 default_questions = [
     "Write a Python program to reverse a string.",
@@ -45,108 +66,223 @@ def extract_video_id(url):
     return None
 
 def get_video_title(video_id):
-    request = youtube.videos().list(part="snippet", id=video_id)
-    response = request.execute()
-    if response["items"]:
-        return response["items"][0]["snippet"]["title"]
-    return "Untitled Video"
+    return youtube_metadata.get_video_title(video_id)
 
 def get_playlist_videos(playlist_id):
-    videos = []
-    request = youtube.playlistItems().list(
-        part="snippet",
-        playlistId=playlist_id,
-        maxResults=50
-    )
-    while request:
-        response = request.execute()
-        for item in response['items']:
-            video_id = item['snippet']['resourceId']['videoId']
-            title = item['snippet']['title']
-            videos.append({'id': video_id, 'title': title})
-        request = youtube.playlistItems().list_next(request, response)
-    return videos
-
-def ask_deepseek(prompt, model="deepseek-chat"):
-    """Sends a prompt to the DeepSeek API and returns the response."""
+    return youtube_metadata.get_playlist_videos(playlist_id)
+
+def ask_deepseek(prompt, model="deepseek-chat", validate=None):
+    """Sends a prompt to the DeepSeek API and returns the response, served from llm_cache when possible.
+
+    When validate is given, only responses it accepts are cached, and a cached
+    response it rejects is dropped and fetched again.
+    """
+    cached = llm_cache.get(prompt, model)
+    if cached is not None:
+        if validate is None or validate(cached):
+            return cached
+        llm_cache.delete(prompt, model)
     try:
-        response = deepseek_client.chat.completions.create(
-            model=model,
-            messages=[{"role": "user", "content": prompt}],
-            stream=False
-        )
-        return response.choices[0].message.content
+        content = llm_backend(prompt, model)
     except Exception as e:
         return f"An error occurred: {e}"
+    if validate is None or validate(content):
+        llm_cache.set(prompt, model, content)
+    return content
 
 
-playlist_or_video_url = input("Enter YouTube Playlist or Video URL: ").strip()
+def parse_question(response_text):
+    """Split a QUESTION:/SOLUTION:/EXPLANATION: response, or return None if the format drifted."""
+    q_start = response_text.find("QUESTION:")
+    s_start = response_text.find("SOLUTION:")
+    e_start = response_text.find("EXPLANATION:")
 
-playlist_id = extract_playlist_id(playlist_or_video_url)
-if playlist_id:
-  
-    videos = get_playlist_videos(playlist_id)
-else:
- 
-    video_id = extract_video_id(playlist_or_video_url)
-    title = get_video_title(video_id)
-    videos = [{'id': video_id, 'title': title}]
+    if q_start != -1 and s_start != -1 and e_start != -1:
+        return {
+            "question": response_text[q_start + len("QUESTION:"):s_start].strip(),
+            "solution": response_text[s_start + len("SOLUTION:"):e_start].strip(),
+            "explanation": response_text[e_start + len("EXPLANATION:"):].strip(),
+        }
+    return None
+
+def generate_question(title, retries=QUESTION_RETRIES):
+    """Ask DeepSeek for a question about a video, retrying with backoff before falling back to a default one."""
+    question_prompt = (
+        f"Create a programming question based on the video title '{title}'. "
+        f"Provide the QUESTION, SOLUTION, and EXPLANATION in this exact format:\n\n"
+        f"QUESTION: [your question here]\nSOLUTION: [your solution here]\nEXPLANATION: [your explanation here]"
+    )
+    for attempt in range(retries):
+        parsed = parse_question(ask_deepseek(question_prompt, validate=parse_question))
+        if parsed:
+            return parsed
+        if attempt + 1 < retries:
+            time.sleep(2 ** attempt)
 
-print(f"\nTotal Levels: {len(videos)}\n")
+    return default_question()
 
-for level, video in enumerate(videos, start=1):
-    print(f"--- Level {level}: {video['title']} ---")
+def default_question():
+    return {
+        "question": random.choice(default_questions),
+        "solution": "Refer to Python documentation.",
+        "explanation": "This is a generic coding task.",
+    }
 
+def parse_question_batch(response_text, indices):
+    """Validate a JSON array of questions, returning {index: question} for the items that match the schema."""
+    text = response_text.strip()
+    fence = re.search(r"```(?:json)?\s*(.*?)```", text, re.DOTALL)
+    if fence:
+        text = fence.group(1)
     try:
-        question_prompt = (
-            f"Create a programming question based on the video title '{video['title']}'. "
-            f"Provide the QUESTION, SOLUTION, and EXPLANATION in this exact format:\n\n"
-            f"QUESTION: [your question here]\nSOLUTION: [your solution here]\nEXPLANATION: [your explanation here]"
-        )
-        
-        response_text = ask_deepseek(question_prompt)
-
-     
-        q_start = response_text.find("QUESTION:")
-        s_start = response_text.find("SOLUTION:")
-        e_start = response_text.find("EXPLANATION:")
-
-        if q_start != -1 and s_start != -1 and e_start != -1:
-            question = response_text[q_start + len("QUESTION:"):s_start].strip()
-            solution = response_text[s_start + len("SOLUTION:"):e_start].strip()
-            explanation = response_text[e_start + len("EXPLANATION:"):].strip()
-        else:
-       
-            question = random.choice(default_questions)
-            solution = "Refer to Python documentation."
-            explanation = "This is a generic coding task."
-
-        print(f"\nQUESTION: {question}\n")
-        print(f"SOLUTION (hidden for now)\nEXPLANATION: {explanation}\n")
-
-        user_answer = input("Enter your solution: ").strip()
-        
-      
-        feedback_prompt = (
-            f"The original question was: '{question}'\n"
-            f"The correct solution: '{solution}'\n"
-            f"User solution: '{user_answer}'\n"
-            f"Provide feedback on correctness, efficiency, and improvements. "
-            f"Be constructive and helpful for learning."
+        items = json.loads(text)
+    except ValueError:
+        return {}
+    if not isinstance(items, list):
+        return {}
+
+    parsed = {}
+    for item in items:
+        if not isinstance(item, dict) or type(item.get("index")) is not int or item["index"] not in indices:
+            continue
+        fields = {name: item.get(name) for name in QUESTION_FIELDS}
+        if all(isinstance(v, str) and v.strip() for v in fields.values()):
+            parsed[item["index"]] = {name: v.strip() for name, v in fields.items()}
+    return parsed
+
+def generate_questions(titles, retries=QUESTION_RETRIES):
+    """Generate questions for many video titles in one request, re-requesting only the items that failed to parse."""
+    results = {}
+    pending = list(range(len(titles)))
+    for attempt in range(retries):
+        videos = [{"index": i, "title": titles[i]} for i in pending]
+        batch_prompt = (
+            "Create one programming question for each of the following video titles.\n"
+            "Respond with only a JSON array, one object per video, in this exact shape:\n"
+            '[{"index": <index from the input>, "question": "...", "solution": "...", "explanation": "..."}]\n\n'
+            f"VIDEOS: {json.dumps(videos)}"
         )
-        
-        feedback = ask_deepseek(feedback_prompt)
-        print(f"\nFeedback: {feedback}\n")
-
-        passed = "correct" in feedback.lower() or "well done" in feedback.lower() or "good" in feedback.lower()
-        if passed:
-            print("✅ Great job! Moving to next level...\n")
-        else:
-            print("❌ You need to solve this correctly to unlock the next level.")
+        wanted = set(pending)
+        response = ask_deepseek(batch_prompt, validate=lambda text: bool(parse_question_batch(text, wanted)))
+        results.update(parse_question_batch(response, wanted))
+        pending = [i for i in pending if i not in results]
+        if not pending:
+            break
+        if attempt + 1 < retries:
+            time.sleep(2 ** attempt)
+
+    return [results.get(i) or default_question() for i in range(len(titles))]
+
+
+class QuestionPrefetcher:
+    """Generates questions for upcoming levels in the background.
+
+    At most PREFETCH_AHEAD levels beyond the current one are requested, on a
+    pool of PREFETCH_WORKERS threads, so the next question is usually ready
+    by the time the player passes the current level. With batch_size > 1,
+    the first level is requested on its own so play can start right away and
+    the rest are requested batch_size at a time through generate_questions(),
+    always keeping the batch after the current one in flight.
+    """
+
+    def __init__(self, videos, lookahead=PREFETCH_AHEAD, max_workers=PREFETCH_WORKERS, batch_size=1):
+        self.videos = videos
+        self.lookahead = lookahead
+        self.batch_size = batch_size
+        self.pool = ThreadPoolExecutor(max_workers=max_workers)
+        self.futures = {}
+
+    def _batch_of(self, index):
+        if index == 0 or self.batch_size == 1:
+            return index
+        return 1 + (index - 1) // self.batch_size
+
+    def _bounds(self, batch):
+        if batch == 0 or self.batch_size == 1:
+            return batch, batch + 1
+        start = 1 + (batch - 1) * self.batch_size
+        return start, start + self.batch_size
+
+    def _schedule(self, batch):
+        start, end = self._bounds(batch)
+        if start < len(self.videos) and batch not in self.futures:
+            titles = [v["title"] for v in self.videos[start:end]]
+            if len(titles) == 1:
+                self.futures[batch] = self.pool.submit(lambda: [generate_question(titles[0])])
+            else:
+                self.futures[batch] = self.pool.submit(generate_questions, titles)
+
+    def get(self, index):
+        current = self._batch_of(index)
+        last = max(current + 1, self._batch_of(index + self.lookahead))
+        for batch in range(current, last + 1):
+            self._schedule(batch)
+        return self.futures[current].result()[index - self._bounds(current)[0]]
+
+    def close(self):
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+
+def run_challenge():
+    playlist_or_video_url = input("Enter YouTube Playlist or Video URL: ").strip()
+
+    playlist_id = extract_playlist_id(playlist_or_video_url)
+    if playlist_id:
+        videos = get_playlist_videos(playlist_id)
+    else:
+        video_id = extract_video_id(playlist_or_video_url)
+        title = get_video_title(video_id)
+        videos = [{'id': video_id, 'title': title}]
+
+    print(f"\nTotal Levels: {len(videos)}\n")
+
+    questions = QuestionPrefetcher(videos, batch_size=QUESTION_BATCH_SIZE)
+    try:
+        play_levels(videos, questions)
+    finally:
+        questions.close()
+
+    print("Challenge completed! 🎉")
+
+
+def play_levels(videos, questions):
+    for level, video in enumerate(videos, start=1):
+        print(f"--- Level {level}: {video['title']} ---")
+
+        try:
+            generated = questions.get(level - 1)
+            question = generated["question"]
+            solution = generated["solution"]
+            explanation = generated["explanation"]
+
+            print(f"\nQUESTION: {question}\n")
+            print(f"SOLUTION (hidden for now)\nEXPLANATION: {explanation}\n")
+
+            user_answer = input("Enter your solution: ").strip()
+
+
+            feedback_prompt = (
+                f"The original question was: '{question}'\n"
+                f"The correct solution: '{solution}'\n"
+                f"User solution: '{user_answer}'\n"
+                f"Provide feedback on correctness, efficiency, and improvements. "
+                f"Be constructive and helpful for learning."
+            )
+
+            feedback = ask_deepseek(feedback_prompt)
+            print(f"\nFeedback: {feedback}\n")
+
+            passed = "correct" in feedback.lower() or "well done" in feedback.lower() or "good" in feedback.lower()
+            if passed:
+                print("✅ Great job! Moving to next level...\n")
+            else:
+                print("❌ You need to solve this correctly to unlock the next level.")
+                break
+
+        except Exception as e:
+            print(f"Error generating question: {e}")
             break
 
-    except Exception as e:
-        print(f"Error generating question: {e}")
-        break
 
-print("Challenge completed! 🎉")
\ No newline at end of file
+if __name__ == "__main__":
+    run_challenge()